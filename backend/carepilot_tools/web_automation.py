@@ -5,12 +5,44 @@ import os
 import re
 import socket
 import uuid
+from functools import lru_cache
 from typing import Any
 from urllib.parse import urlparse
 
 from memory.time_utils import parse_iso
 
 
+def _blocked_ip(ip: Any) -> bool:
+    return bool(
+        ip.is_private
+        or ip.is_loopback
+        or ip.is_link_local
+        or ip.is_multicast
+        or ip.is_reserved
+        or ip.is_unspecified
+    )
+
+
+@lru_cache(maxsize=512)
+def _classify_url(value: str) -> tuple[str, str, bool | None] | None:
+    """Pure URL parse/classify step: (scheme, host, literal-IP blocked or None for hostnames)."""
+    if not value.startswith("http://") and not value.startswith("https://"):
+        return None
+    parsed = urlparse(value)
+    if parsed.scheme not in {"http", "https"}:
+        return None
+    host = (parsed.hostname or "").strip().lower()
+    if not host:
+        return None
+    if host in {"localhost", "localhost.localdomain"} or host.endswith(".local"):
+        return None
+    try:
+        literal_blocked: bool | None = _blocked_ip(ipaddress.ip_address(host))
+    except ValueError:
+        literal_blocked = None
+    return parsed.scheme, host, literal_blocked
+
+
 class BrowserAutomationRunner:
     """Local browser automation runner inspired by OpenClaw browser tool patterns."""
 
@@ -306,49 +338,30 @@ class BrowserAutomationRunner:
         value = str(raw_url or "").strip()
         if not value:
             return None
-        if not value.startswith("http://") and not value.startswith("https://"):
-            return None
-        parsed = urlparse(value)
-        if parsed.scheme not in {"http", "https"}:
+        classified = _classify_url(value)
+        if classified is None:
             return None
+        scheme, host, literal_blocked = classified
         allow_insecure_http = os.getenv("CAREPILOT_ALLOW_INSECURE_HTTP", "false").strip().lower() == "true"
-        if parsed.scheme == "http" and not allow_insecure_http:
-            return None
-        host = (parsed.hostname or "").strip().lower()
-        if not host:
+        if scheme == "http" and not allow_insecure_http:
             return None
-        if host in {"localhost", "localhost.localdomain"} or host.endswith(".local"):
-            return None
-
-        def _blocked_ip(ip: Any) -> bool:
-            return bool(
-                ip.is_private
-                or ip.is_loopback
-                or ip.is_link_local
-                or ip.is_multicast
-                or ip.is_reserved
-                or ip.is_unspecified
-            )
-
+        if literal_blocked is not None:
+            return None if literal_blocked else value
+        # DNS answers and env flags can change between calls, so this part is never cached.
         try:
-            parsed_ip = ipaddress.ip_address(host)
-            if _blocked_ip(parsed_ip):
-                return None
-        except ValueError:
+            resolved = socket.getaddrinfo(host, None, proto=socket.IPPROTO_TCP)
+        except socket.gaierror:
+            allow_unresolved = os.getenv("CAREPILOT_BROWSER_ALLOW_UNRESOLVED_HOSTS", "false").strip().lower() == "true"
+            if allow_unresolved and "." in host:
+                return value
+            return None
+        for entry in resolved:
             try:
-                resolved = socket.getaddrinfo(host, None, proto=socket.IPPROTO_TCP)
-            except socket.gaierror:
-                allow_unresolved = os.getenv("CAREPILOT_BROWSER_ALLOW_UNRESOLVED_HOSTS", "false").strip().lower() == "true"
-                if allow_unresolved and "." in host:
-                    return value
+                resolved_ip = ipaddress.ip_address(entry[4][0])
+            except Exception:
+                continue
+            if _blocked_ip(resolved_ip):
                 return None
-            for entry in resolved:
-                try:
-                    resolved_ip = ipaddress.ip_address(entry[4][0])
-                except Exception:
-                    continue
-                if _blocked_ip(resolved_ip):
-                    return None
         return value
 
     @staticmethod
@@ -12,9 +12,9 @@ from pathlib import Path
 from typing import Any
 
 import httpx
-from fastapi import FastAPI, File, Form, Header, HTTPException, UploadFile
+from fastapi import FastAPI, File, Form, Header, HTTPException, Request, UploadFile
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import StreamingResponse
+from fastapi.responses import JSONResponse, StreamingResponse
 from pydantic import BaseModel, Field
 
 from carepilot_agent_core import (
@@ -134,7 +134,8 @@ class CarePilotApp:
             "CAREPILOT_DB_PATH",
             str((Path(__file__).resolve().parent / "carepilot.sqlite")),
         )
-        self.db = SQLiteMemoryDB(db_path)
+        durable = os.getenv("CAREPILOT_DB_DURABLE", "true").strip().lower() == "true"
+        self.db = SQLiteMemoryDB(db_path, durable=durable)
         self.memory = MemoryService(self.db)
         self.registry = ToolRegistry()
         self.toolset = CarePilotToolset(self.memory)
@@ -310,12 +311,19 @@ def _emit_sse(event: str, data: dict[str, Any]) -> str:
     return f"event: {event}\ndata: {json.dumps(data)}\n\n"
 
 
+def _emit_sse_tokens(text: str) -> str:
+    # One token frame per character (same wire format), yielded as a single chunk so the
+    # sync generator costs one threadpool hop per reply instead of one per character.
+    return "".join(_emit_sse("token", {"delta": chunk}) for chunk in text)
+
+
 _OPENAI_API_BASE = os.getenv("OPENAI_API_BASE_URL", "https://api.openai.com/v1").rstrip("/")
 _OPENROUTER_API_BASE = os.getenv("OPENROUTER_BASE_URL", "https://openrouter.ai/api/v1").rstrip("/")
 _DEDALUS_API_BASE = os.getenv("DEDALUS_BASE_URL", os.getenv("DEDALUS_API_BASE_URL", "https://api.dedaluslabs.ai/v1")).rstrip("/")
 _ANTHROPIC_API_BASE = os.getenv("ANTHROPIC_API_BASE_URL", "https://api.anthropic.com/v1").rstrip("/")
 _MAX_AUDIO_BYTES = int(os.getenv("CAREPILOT_MAX_AUDIO_BYTES", str(20 * 1024 * 1024)))
 _MAX_DOCUMENT_BYTES = int(os.getenv("CAREPILOT_MAX_DOCUMENT_BYTES", str(25 * 1024 * 1024)))
+_AUDIO_TOO_LARGE_DETAIL = f"Audio file exceeds {_MAX_AUDIO_BYTES // (1024 * 1024)}MB limit."
 _ALLOWED_AUDIO_MIME_TYPES = {
     "audio/mpeg",
     "audio/mp3",
@@ -380,6 +388,17 @@ async def _read_upload_bytes(upload: UploadFile, *, max_bytes: int, too_large_de
     return raw
 
 
+async def _read_request_body(request: Request, *, max_bytes: int, too_large_detail: str) -> bytes:
+    buffer = bytearray()
+    async for chunk in request.stream():
+        buffer.extend(chunk)
+        if len(buffer) > max_bytes:
+            raise HTTPException(status_code=413, detail=too_large_detail)
+    if not buffer:
+        raise HTTPException(status_code=400, detail="Uploaded file is empty.")
+    return bytes(buffer)
+
+
 def _provider_error_message(response: httpx.Response) -> str:
     message = response.text.strip()
     try:
@@ -2883,34 +2902,26 @@ def actions_execute(
     return {"status": "success" if success else "failure", "result": result_payload}
 
 
-@app.post("/voice/transcribe")
-async def voice_transcribe(
-    audio: UploadFile | None = File(default=None),
-    file: UploadFile | None = File(default=None),
-    session_key: str | None = Form(default=None),
-    language_hint: str | None = Form(default=None),
-    prompt: str | None = Form(default=None),
-    authorization: str | None = Header(default=None),
-    x_user_id: str | None = Header(default=None),
-):
-    user_id = resolve_user_id(authorization, x_user_id)
+def _voice_ctx(user_id: str, session_key: str | None) -> ExecutionContext:
     ctx = _build_ctx(user_id=user_id, session_key=session_key)
     try:
         container.memory.guard.ensure_user_scope(user_id, user_id)
         container.memory.guard.ensure_session_scope(ctx.session_key)
     except MemoryPolicyError as exc:
         raise HTTPException(status_code=400, detail=str(exc)) from exc
+    return ctx
 
-    upload = _select_upload(audio, file, field_hint="audio")
-    file_name = _normalize_upload_filename(upload, "audio-upload")
-    mime_type = (upload.content_type or "").lower().strip()
-    _validate_audio_upload(file_name, mime_type)
 
-    audio_bytes = await _read_upload_bytes(
-        upload,
-        max_bytes=_MAX_AUDIO_BYTES,
-        too_large_detail=f"Audio file exceeds {_MAX_AUDIO_BYTES // (1024 * 1024)}MB limit.",
-    )
+def _transcribe_and_store_voice(
+    *,
+    user_id: str,
+    ctx: ExecutionContext,
+    file_name: str,
+    mime_type: str,
+    audio_bytes: bytes,
+    language_hint: str | None,
+    prompt: str | None,
+) -> JSONResponse:
     transcription = _openai_whisper_transcribe(
         file_name=file_name,
         mime_type=mime_type,
@@ -2967,19 +2978,91 @@ async def voice_transcribe(
         },
         findings=findings,
     )
-    return {
-        "document_id": document_id,
-        "transcript_text": transcript_text,
-        "confidence": confidence,
-        "segments": transcription.get("segments", []),
-        "triage": {
-            "tier": triage_tier,
-            "emergency": emergency_detected,
-        },
-        "requires_confirmation": True,
-        "editable_transcript": True,
-        "next_step": "review_or_edit_transcript_before_chat_send",
-    }
+    # Payload is JSON-native already (provider segments are decoded JSON), so skip jsonable_encoder.
+    return JSONResponse(
+        {
+            "document_id": document_id,
+            "transcript_text": transcript_text,
+            "confidence": confidence,
+            "segments": transcription.get("segments", []),
+            "triage": {
+                "tier": triage_tier,
+                "emergency": emergency_detected,
+            },
+            "requires_confirmation": True,
+            "editable_transcript": True,
+            "next_step": "review_or_edit_transcript_before_chat_send",
+        }
+    )
+
+
+@app.post("/voice/transcribe")
+async def voice_transcribe(
+    audio: UploadFile | None = File(default=None),
+    file: UploadFile | None = File(default=None),
+    session_key: str | None = Form(default=None),
+    language_hint: str | None = Form(default=None),
+    prompt: str | None = Form(default=None),
+    authorization: str | None = Header(default=None),
+    x_user_id: str | None = Header(default=None),
+):
+    user_id = resolve_user_id(authorization, x_user_id)
+    ctx = _voice_ctx(user_id, session_key)
+
+    upload = _select_upload(audio, file, field_hint="audio")
+    file_name = _normalize_upload_filename(upload, "audio-upload")
+    mime_type = (upload.content_type or "").lower().strip()
+    _validate_audio_upload(file_name, mime_type)
+
+    audio_bytes = await _read_upload_bytes(
+        upload,
+        max_bytes=_MAX_AUDIO_BYTES,
+        too_large_detail=_AUDIO_TOO_LARGE_DETAIL,
+    )
+    return _transcribe_and_store_voice(
+        user_id=user_id,
+        ctx=ctx,
+        file_name=file_name,
+        mime_type=mime_type,
+        audio_bytes=audio_bytes,
+        language_hint=language_hint,
+        prompt=prompt,
+    )
+
+
+@app.post("/voice/transcribe/raw")
+async def voice_transcribe_raw(
+    request: Request,
+    session_key: str | None = None,
+    language_hint: str | None = None,
+    prompt: str | None = None,
+    filename: str | None = None,
+    authorization: str | None = Header(default=None),
+    x_user_id: str | None = Header(default=None),
+):
+    # Same contract as /voice/transcribe, but the audio is the raw request body (no multipart framing);
+    # metadata travels in query params and the MIME type in Content-Type.
+    user_id = resolve_user_id(authorization, x_user_id)
+    ctx = _voice_ctx(user_id, session_key)
+
+    file_name = (filename or "").strip() or "audio-upload"
+    mime_type = (request.headers.get("content-type") or "").split(";", 1)[0].lower().strip()
+    _validate_audio_upload(file_name, mime_type)
+
+    audio_bytes = await _read_request_body(
+        request,
+        max_bytes=_MAX_AUDIO_BYTES,
+        too_large_detail=_AUDIO_TOO_LARGE_DETAIL,
+    )
+    return _transcribe_and_store_voice(
+        user_id=user_id,
+        ctx=ctx,
+        file_name=file_name,
+        mime_type=mime_type,
+        audio_bytes=audio_bytes,
+        language_hint=language_hint,
+        prompt=prompt,
+    )
 
 
 @app.post("/documents/analyze")
@@ -3164,8 +3247,7 @@ def chat_stream(
             dump_check = container.memory.check_dump_guard(payload.message)
             if dump_check["blocked"]:
                 message = "I can’t provide a broad memory dump. Ask for a specific section instead."
-                for chunk in message:
-                    yield _emit_sse("token", {"delta": chunk})
+                yield _emit_sse_tokens(message)
                 yield _emit_sse("message", {"text": message})
                 return
 
@@ -3174,8 +3256,7 @@ def chat_stream(
                     "This may be an emergency. Call 911 or local emergency services now. "
                     "I will not run booking or refill actions in this context."
                 )
-                for chunk in message:
-                    yield _emit_sse("token", {"delta": chunk})
+                yield _emit_sse_tokens(message)
                 yield _emit_sse("message", {"text": message})
                 container.memory.clinical.append_policy_event(
                     user_id=user_id,
@@ -3226,8 +3307,7 @@ def chat_stream(
                 summary_text=payload.message[:400],
                 tags=["chat_turn"],
             )
-            for chunk in reply:
-                yield _emit_sse("token", {"delta": chunk})
+            yield _emit_sse_tokens(reply)
             yield _emit_sse("message", {"text": reply})
 
             if booking_handled:
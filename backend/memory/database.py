@@ -8,9 +8,10 @@ from typing import Iterator
 
 
 class SQLiteMemoryDB:
-    def __init__(self, db_path: str) -> None:
+    def __init__(self, db_path: str, *, durable: bool = True) -> None:
         self._path = Path(db_path).expanduser().resolve()
         self._path.parent.mkdir(parents=True, exist_ok=True)
+        self._durable = durable
         self._lock = threading.Lock()
         self._init_schema()
 
@@ -22,6 +23,11 @@ class SQLiteMemoryDB:
         conn = sqlite3.connect(str(self._path), timeout=30.0, check_same_thread=False)
         conn.row_factory = sqlite3.Row
         conn.execute("PRAGMA foreign_keys = ON")
+        if not self._durable:
+            # Throwaway DBs (tests, benchmarks) skip fsync and keep the rollback journal in memory.
+            conn.execute("PRAGMA synchronous = OFF")
+            conn.execute("PRAGMA journal_mode = MEMORY")
+            conn.execute("PRAGMA temp_store = MEMORY")
         return conn
 
     @contextmanager
@@ -110,6 +116,7 @@ class SQLiteMemoryDB:
                   updated_at TEXT NOT NULL
                 );
 
+                -- Small rows always addressed by their text id: store them in the PK B-tree directly.
                 CREATE TABLE IF NOT EXISTS inferences (
                   id TEXT PRIMARY KEY,
                   user_id TEXT NOT NULL,
@@ -119,7 +126,7 @@ class SQLiteMemoryDB:
                   created_at TEXT NOT NULL,
                   expires_at TEXT NOT NULL,
                   updated_at TEXT NOT NULL
-                );
+                ) WITHOUT ROWID;
 
                 CREATE TABLE IF NOT EXISTS appointments (
                   id TEXT PRIMARY KEY,
@@ -253,6 +260,8 @@ class SQLiteMemoryDB:
                   ON medications(user_id, status);
                 CREATE INDEX IF NOT EXISTS idx_symptom_states_user_status
                   ON symptom_states(user_id, status);
+                CREATE INDEX IF NOT EXISTS idx_inferences_user_status_expires
+                  ON inferences(user_id, status, expires_at);
                 CREATE INDEX IF NOT EXISTS idx_appointments_user_starts
                   ON appointments(user_id, starts_at);
                 CREATE INDEX IF NOT EXISTS idx_action_audit_user_started
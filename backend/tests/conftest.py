@@ -1,6 +1,8 @@
 from __future__ import annotations
 
+import functools
 import importlib
+import sqlite3
 import sys
 from pathlib import Path
 from typing import Callable
@@ -18,6 +20,8 @@ def backend_module(tmp_path, monkeypatch):
     db_path = tmp_path / "carepilot-test.sqlite"
     monkeypatch.setenv("CAREPILOT_DB_PATH", str(db_path))
     monkeypatch.setenv("ALLOW_ANON", "false")
+    # Per-test DBs are discarded, so skip fsync/journal durability work.
+    monkeypatch.setenv("CAREPILOT_DB_DURABLE", "false")
     # Keep CI deterministic; dedicated provider tests can override this.
     monkeypatch.setenv("CAREPILOT_DISABLE_EXTERNAL_WEB", "true")
 
@@ -35,8 +39,26 @@ def client(backend_module):
 
 
 @pytest.fixture
+def db_conn(backend_module):
+    # Autocommit connection held for the whole test so assertions don't reopen SQLite per query.
+    conn = sqlite3.connect(backend_module.container.db.path, isolation_level=None, check_same_thread=False)
+    conn.row_factory = sqlite3.Row
+    try:
+        yield conn
+    finally:
+        conn.close()
+
+
+@pytest.fixture(scope="session")
 def auth_headers() -> Callable[[str], dict[str, str]]:
+    # Header dicts are shared across tests, so callers must treat them as read-only.
+    @functools.cache
     def _make(user_id: str) -> dict[str, str]:
         return {"Authorization": f"Bearer {user_id}"}
 
     return _make
+
+
+@pytest.fixture(scope="session")
+def auth_headers_user_a(auth_headers) -> dict[str, str]:
+    return auth_headers("user-a")
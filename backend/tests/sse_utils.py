@@ -1,20 +1,22 @@
 from __future__ import annotations
 
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterable, Iterator, List
 
 
-def parse_sse_events(payload_text: str) -> List[Dict[str, Any]]:
-    events: List[Dict[str, Any]] = []
+def iter_sse_events(lines: Iterable[str]) -> Iterator[Dict[str, Any]]:
+    # Callers pass str.splitlines() or Response.iter_lines(), both of which already drop "\r".
     current: Dict[str, Any] = {}
-    for raw_line in payload_text.splitlines():
-        line = raw_line.strip("\r")
+    for line in lines:
         if line.startswith("event: "):
             current["event"] = line[7:]
         elif line.startswith("data: "):
             current["data"] = line[6:]
         elif line == "" and current:
-            events.append(current)
+            yield current
             current = {}
     if current:
-        events.append(current)
-    return events
+        yield current
+
+
+def parse_sse_events(payload_text: str) -> List[Dict[str, Any]]:
+    return list(iter_sse_events(payload_text.splitlines()))
@@ -1,6 +1,15 @@
 from __future__ import annotations
 
-from fastapi import HTTPException
+import io
+
+_FAKE_AUDIO_BUF = io.BytesIO(b"fake-audio-bytes")
+_WAV_AUDIO_BUF = io.BytesIO(b"wav-bytes")
+
+
+def _audio_upload(file_name: str, buffer: io.BytesIO, mime_type: str) -> dict:
+    # Buffers are shared across tests; rewind so the multipart encoder streams them from the start.
+    buffer.seek(0)
+    return {"audio": (file_name, buffer, mime_type)}
 
 
 def test_voice_transcribe_success_persists_scoped_analysis(client, auth_headers, backend_module, monkeypatch):
@@ -18,7 +27,7 @@ def test_voice_transcribe_success_persists_scoped_analysis(client, auth_headers,
         "/voice/transcribe",
         headers=auth_headers("user-a"),
         data={"session_key": "session-a", "language_hint": "en"},
-        files={"audio": ("symptoms.m4a", b"fake-audio-bytes", "audio/m4a")},
+        files=_audio_upload("symptoms.m4a", _FAKE_AUDIO_BUF, "audio/m4a"),
     )
     assert response.status_code == 200
     payload = response.json()
@@ -59,7 +68,7 @@ def test_voice_transcribe_success_persists_scoped_analysis(client, auth_headers,
         assert finding["user_id"] == "user-a"
         assert finding["session_key"] == "session-a"
         assert finding["finding_type"] == "voice_transcript"
-        assert "dizziness" in (finding["value_text"] or "").lower()
+        assert "dizziness" in (finding["value_text"] or "").casefold()
 
 
 def test_voice_transcribe_rejects_unsupported_format(client, auth_headers):
@@ -70,10 +79,12 @@ def test_voice_transcribe_rejects_unsupported_format(client, auth_headers):
         files={"audio": ("not-audio.txt", b"hello", "text/plain")},
     )
     assert response.status_code == 415
-    assert "unsupported audio format" in response.json()["detail"].lower()
+    assert "unsupported audio format" in response.json()["detail"].casefold()
 
 
 def test_voice_transcribe_provider_timeout_surfaces_clear_error(client, auth_headers, backend_module, monkeypatch):
+    from fastapi import HTTPException
+
     def fake_transcribe(**kwargs):
         raise HTTPException(status_code=504, detail="Transcription provider timed out.")
 
@@ -82,10 +93,10 @@ def test_voice_transcribe_provider_timeout_surfaces_clear_error(client, auth_hea
         "/voice/transcribe",
         headers=auth_headers("user-a"),
         data={"session_key": "session-a"},
-        files={"audio": ("symptoms.wav", b"wav-bytes", "audio/wav")},
+        files=_audio_upload("symptoms.wav", _WAV_AUDIO_BUF, "audio/wav"),
     )
     assert response.status_code == 504
-    assert "timed out" in response.json()["detail"].lower()
+    assert "timed out" in response.json()["detail"].casefold()
 
 
 def test_voice_transcribe_emergent_metadata_when_transcript_is_high_risk(client, auth_headers, backend_module, monkeypatch):
@@ -102,7 +113,7 @@ def test_voice_transcribe_emergent_metadata_when_transcript_is_high_risk(client,
         "/voice/transcribe",
         headers=auth_headers("user-a"),
         data={"session_key": "session-a"},
-        files={"audio": ("symptoms.wav", b"wav-bytes", "audio/wav")},
+        files=_audio_upload("symptoms.wav", _WAV_AUDIO_BUF, "audio/wav"),
     )
     assert response.status_code == 200
     payload = response.json()
@@ -110,3 +121,76 @@ def test_voice_transcribe_emergent_metadata_when_transcript_is_high_risk(client,
     assert payload["triage"]["emergency"] is True
     assert payload["requires_confirmation"] is True
     assert payload["editable_transcript"] is True
+
+
+def test_voice_transcribe_raw_body_matches_multipart_contract(client, auth_headers, backend_module, monkeypatch):
+    captured = {}
+
+    def fake_transcribe(**kwargs):
+        captured.update(kwargs)
+        return {
+            "transcript_text": "I have dizziness and missed two doses.",
+            "confidence": 0.92,
+            "segments": [{"id": 0, "text": "I have dizziness and missed two doses."}],
+            "provider_payload": {"mock": True},
+        }
+
+    monkeypatch.setattr(backend_module, "_openai_whisper_transcribe", fake_transcribe)
+    response = client.post(
+        "/voice/transcribe/raw",
+        headers={**auth_headers("user-a"), "Content-Type": "audio/m4a"},
+        params={"session_key": "session-a", "language_hint": "en", "filename": "symptoms.m4a"},
+        content=b"fake-audio-bytes",
+    )
+    assert response.status_code == 200
+    payload = response.json()
+    assert payload["document_id"].startswith("doc_")
+    assert payload["requires_confirmation"] is True
+    assert captured["audio_bytes"] == b"fake-audio-bytes"
+    assert captured["file_name"] == "symptoms.m4a"
+    assert captured["mime_type"] == "audio/m4a"
+    assert captured["language_hint"] == "en"
+
+    with backend_module.container.db.connection() as conn:
+        doc = conn.execute(
+            "SELECT user_id, session_key, file_category FROM documents WHERE id = ?",
+            (payload["document_id"],),
+        ).fetchone()
+    assert doc is not None
+    assert doc["user_id"] == "user-a"
+    assert doc["session_key"] == "session-a"
+    assert doc["file_category"] == "voice_attachment"
+
+
+def test_voice_transcribe_raw_body_rejects_unsupported_format(client, auth_headers):
+    response = client.post(
+        "/voice/transcribe/raw",
+        headers={**auth_headers("user-a"), "Content-Type": "text/plain"},
+        params={"session_key": "session-a", "filename": "not-audio.txt"},
+        content=b"hello",
+    )
+    assert response.status_code == 415
+    assert "unsupported audio format" in response.json()["detail"].casefold()
+
+
+def test_voice_transcribe_raw_body_rejects_oversized_audio(client, auth_headers, backend_module, monkeypatch):
+    monkeypatch.setattr(backend_module, "_MAX_AUDIO_BYTES", 8)
+    response = client.post(
+        "/voice/transcribe/raw",
+        headers={**auth_headers("user-a"), "Content-Type": "audio/m4a"},
+        params={"session_key": "session-a", "filename": "symptoms.m4a"},
+        content=b"fake-audio-bytes",
+    )
+    assert response.status_code == 413
+    assert response.json()["detail"] == backend_module._AUDIO_TOO_LARGE_DETAIL
+
+
+def test_voice_transcribe_raw_body_rejects_empty_audio(client, auth_headers):
+    response = client.post(
+        "/voice/transcribe/raw",
+        headers={**auth_headers("user-a"), "Content-Type": "audio/m4a"},
+        params={"session_key": "session-a", "filename": "symptoms.m4a"},
+        content=b"",
+    )
+    assert response.status_code == 400
+    assert "empty" in response.json()["detail"].lower()
@@ -2,54 +2,64 @@ from __future__ import annotations
 
 import socket
 
-from carepilot_tools.web_automation import BrowserAutomationRunner
-
-
-def test_normalize_url_rejects_localhost_and_private_hosts():
-    assert BrowserAutomationRunner._normalize_url("http://127.0.0.1:8000") is None
-    assert BrowserAutomationRunner._normalize_url("http://localhost:3000") is None
-    assert BrowserAutomationRunner._normalize_url("http://10.0.0.8") is None
-    assert BrowserAutomationRunner._normalize_url("http://192.168.1.2") is None
-
-
-def test_normalize_url_accepts_public_https(monkeypatch):
-    monkeypatch.setattr(
-        socket,
-        "getaddrinfo",
-        lambda *_args, **_kwargs: [(socket.AF_INET, socket.SOCK_STREAM, socket.IPPROTO_TCP, "", ("93.184.216.34", 0))],
-    )
-    assert BrowserAutomationRunner._normalize_url("https://example.com/path") == "https://example.com/path"
-
-
-def test_normalize_url_rejects_public_http_by_default():
-    assert BrowserAutomationRunner._normalize_url("http://example.com/path") is None
-
+import pytest
 
-def test_normalize_url_allows_public_http_when_enabled(monkeypatch):
-    monkeypatch.setenv("CAREPILOT_ALLOW_INSECURE_HTTP", "true")
-    monkeypatch.setattr(
-        socket,
-        "getaddrinfo",
-        lambda *_args, **_kwargs: [(socket.AF_INET, socket.SOCK_STREAM, socket.IPPROTO_TCP, "", ("93.184.216.34", 0))],
-    )
-    assert BrowserAutomationRunner._normalize_url("http://example.com/path") == "http://example.com/path"
-
-
-def test_normalize_url_rejects_unresolved_hostnames_by_default(monkeypatch):
-    monkeypatch.delenv("CAREPILOT_BROWSER_ALLOW_UNRESOLVED_HOSTS", raising=False)
-
-    def _raise_gaierror(*_args, **_kwargs):
-        raise socket.gaierror("dns unavailable")
-
-    monkeypatch.setattr(socket, "getaddrinfo", _raise_gaierror)
-    assert BrowserAutomationRunner._normalize_url("https://example.com/path") is None
-
-
-def test_normalize_url_allows_unresolved_hostnames_when_explicitly_enabled(monkeypatch):
-    monkeypatch.setenv("CAREPILOT_BROWSER_ALLOW_UNRESOLVED_HOSTS", "true")
+from carepilot_tools.web_automation import BrowserAutomationRunner
 
-    def _raise_gaierror(*_args, **_kwargs):
-        raise socket.gaierror("dns unavailable")
 
-    monkeypatch.setattr(socket, "getaddrinfo", _raise_gaierror)
-    assert BrowserAutomationRunner._normalize_url("https://example.com/path") == "https://example.com/path"
+def _fake_getaddrinfo(*_args, **_kwargs):
+    return [(socket.AF_INET, socket.SOCK_STREAM, socket.IPPROTO_TCP, "", ("93.184.216.34", 0))]
+
+
+def _raise_gaierror(*_args, **_kwargs):
+    raise socket.gaierror("dns unavailable")
+
+
+@pytest.mark.parametrize(
+    ("url", "env", "dns", "expected"),
+    [
+        # Loopback, localhost and private ranges are rejected without touching DNS.
+        ("http://127.0.0.1:8000", {}, None, None),
+        ("http://localhost:3000", {}, None, None),
+        ("http://10.0.0.8", {}, None, None),
+        ("http://192.168.1.2", {}, None, None),
+        # Public HTTPS hosts that resolve to public addresses are accepted.
+        ("https://example.com/path", {}, _fake_getaddrinfo, "https://example.com/path"),
+        # Plain HTTP is only accepted behind the explicit insecure opt-in.
+        ("http://example.com/path", {"CAREPILOT_ALLOW_INSECURE_HTTP": None}, None, None),
+        (
+            "http://example.com/path",
+            {"CAREPILOT_ALLOW_INSECURE_HTTP": "true"},
+            _fake_getaddrinfo,
+            "http://example.com/path",
+        ),
+        # Unresolvable hosts are rejected unless explicitly allowed.
+        ("https://example.com/path", {"CAREPILOT_BROWSER_ALLOW_UNRESOLVED_HOSTS": None}, _raise_gaierror, None),
+        (
+            "https://example.com/path",
+            {"CAREPILOT_BROWSER_ALLOW_UNRESOLVED_HOSTS": "true"},
+            _raise_gaierror,
+            "https://example.com/path",
+        ),
+    ],
+    ids=[
+        "rejects-loopback-ip",
+        "rejects-localhost",
+        "rejects-private-10",
+        "rejects-private-192",
+        "accepts-public-https",
+        "rejects-public-http-by-default",
+        "allows-public-http-when-enabled",
+        "rejects-unresolved-by-default",
+        "allows-unresolved-when-enabled",
+    ],
+)
+def test_normalize_url(monkeypatch, url, env, dns, expected):
+    for name, value in env.items():
+        if value is None:
+            monkeypatch.delenv(name, raising=False)
+        else:
+            monkeypatch.setenv(name, value)
+    if dns is not None:
+        monkeypatch.setattr(socket, "getaddrinfo", dns)
+    assert BrowserAutomationRunner._normalize_url(url) == expected
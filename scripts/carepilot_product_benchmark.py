@@ -1,17 +1,28 @@
 #!/usr/bin/env python3
 from __future__ import annotations
 
+import argparse
+import asyncio
+import contextlib
 import importlib
 import io
 import json
 import os
+import re
 import sys
 import tempfile
 from dataclasses import dataclass, field
+from operator import itemgetter
 from pathlib import Path
-from typing import Any
+from typing import Any, Awaitable, Callable, TextIO
+from unittest import mock
 
-from fastapi.testclient import TestClient
+import httpx
+
+try:
+    import orjson
+except ImportError:  # optional speedup; stdlib json is the fallback
+    orjson = None
 
 ROOT = Path(__file__).resolve().parents[1]
 BACKEND_DIR = ROOT / "backend"
@@ -20,8 +31,48 @@ if str(BACKEND_DIR) not in sys.path:
 
 from carepilot_tools.web_automation import BrowserAutomationRunner
 
+# Static env for every run; CAREPILOT_DB_PATH is added per run. Applied via mock.patch.dict so the
+# caller's environment is restored when the benchmark finishes.
+_BENCH_ENV = {
+    "ALLOW_ANON": "false",
+    "CAREBASE_ONLY": "false",
+    # The benchmark DB is discarded after each run, so skip fsync and on-disk journaling.
+    "CAREPILOT_DB_DURABLE": "false",
+    "CAREPILOT_DISABLE_EXTERNAL_WEB": "false",
+    "CAREPILOT_WEB_TIMEOUT_SECONDS": "0.8",
+    "CAREPILOT_BROWSER_TIMEOUT_MS": "3000",
+    "CAREPILOT_BROWSER_MAX_STEPS": "1",
+    "ANTHROPIC_API_KEY": "",
+    "DEDALUS_API_KEY": "",
+    "OPENROUTER_API_KEY": "",
+    "OPENAI_API_KEY": "",
+}
+
+# Shared request headers; never mutated, so every call can reuse the same dicts.
+_HEADERS = {"Authorization": "Bearer benchmark-user"}
+_HEADERS_USER2 = {"Authorization": "Bearer benchmark-user-2"}
+
+_EMERGENCY_RE = re.compile(r"call 911|emergency")
+_URGENT_RE = re.compile(r"urgent_24h|within 24(?: hours|h)")
+_PAUSE_RE = re.compile(r"paused|snooze|resume")
+# Lowercase phrases matched against an already-lowered reply.
+_UNCERTAINTY_SENTINELS = ("can't diagnose", "cannot diagnose")
+_RECALL_SENTINELS = ("active symptoms", "headache", "nausea")
+_CONSENT_SENTINELS = ("consent token",)
+_DUMP_SENTINELS = ("can't provide a broad memory dump", "specific section")
+_MAX_EVIDENCE = 240
+_SEVERITY_RANK = {"critical": 0, "high": 1, "medium": 2, "low": 3}
+_PRIVACY_ROUTE_CANDIDATES = frozenset({"/data/export", "/privacy/export", "/data/delete", "/privacy/delete"})
+_DASHBOARD_ROUTE_CANDIDATES = frozenset({"/dashboard/health", "/tracking/dashboard", "/health-dashboard"})
+_SAFETY_ROUTE_CANDIDATES = frozenset({"/safety-mode/enable", "/safety-mode/status", "/incident/safe-mode"})
+_TURN_EVENTS = frozenset({"message", "action_plan"})
+_WANTED_EVENTS = _TURN_EVENTS | {"error"}
+
+# The backend imported under _BENCH_ENV; repeat runs in one process skip the full reload.
+_BACKEND_MODULE: Any = None
+
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class CheckOutcome:
     name: str
     passed: bool
@@ -32,22 +83,28 @@ class CheckOutcome:
     issue: str | None = None
 
 
-@dataclass
+@dataclass(slots=True)
 class RequirementOutcome:
     requirement_id: str
     title: str
     checks: list[CheckOutcome] = field(default_factory=list)
+    # Running totals and the failure subset, kept in step with `checks` by add_check().
+    points: int = 0
+    max_points: int = 0
+    failed_checks: list[CheckOutcome] = field(default_factory=list)
+    skipped: bool = False
 
-    @property
-    def points(self) -> int:
-        return sum(check.points for check in self.checks)
-
-    @property
-    def max_points(self) -> int:
-        return sum(check.max_points for check in self.checks)
+    def add_check(self, check: CheckOutcome) -> None:
+        self.checks.append(check)
+        self.points += check.points
+        self.max_points += check.max_points
+        if not check.passed:
+            self.failed_checks.append(check)
 
     @property
     def status(self) -> str:
+        if self.skipped:
+            return "SKIPPED"
         if self.points == self.max_points:
             return "PASS"
         if self.points == 0:
@@ -55,45 +112,97 @@ class RequirementOutcome:
         return "PARTIAL"
 
 
-def _parse_sse_events(raw_text: str) -> list[dict[str, Any]]:
-    events: list[dict[str, Any]] = []
-    current: dict[str, Any] = {}
-    for raw_line in raw_text.splitlines():
-        line = raw_line.strip("\r")
-        if line.startswith("event: "):
-            current["event"] = line[7:]
-        elif line.startswith("data: "):
-            current["data"] = line[6:]
-        elif line == "" and current:
-            events.append(current)
-            current = {}
-    if current:
-        events.append(current)
-    return events
-
-
-def _first_event(events: list[dict[str, Any]], event_name: str) -> dict[str, Any] | None:
-    for event in events:
-        if event.get("event") != event_name:
-            continue
-        data = event.get("data")
-        if isinstance(data, str):
-            try:
-                return json.loads(data)
-            except json.JSONDecodeError:
-                return {"raw": data}
-    return None
-
-
-def _chat_stream(
-    client: TestClient,
+@dataclass(frozen=True, slots=True)
+class SuiteSpec:
+    requirement_id: str
+    title: str
+    # Adds its checks to the RequirementOutcome created for it by the runner.
+    run: Callable[[httpx.AsyncClient, dict[str, str], RouteIndex, RequirementOutcome], Awaitable[None]]
+    # Suites sharing a phase run concurrently; phases run in ascending order.
+    phase: int
+
+
+@dataclass(frozen=True, slots=True)
+class ChatTurn:
+    status_code: int
+    text: str
+    action_plan: dict[str, Any] | None
+    error: dict[str, Any] | None
+
+
+@dataclass(frozen=True, slots=True)
+class RouteIndex:
+    paths: frozenset[str]
+    # Sorted route groups the suites report as evidence, filtered once per run.
+    privacy: tuple[str, ...]
+    health: tuple[str, ...]
+    dashboard: tuple[str, ...]
+    safety: tuple[str, ...]
+
+    @classmethod
+    def from_app(cls, app: Any) -> RouteIndex:
+        ordered = sorted({route.path for route in app.routes})
+        return cls(
+            paths=frozenset(ordered),
+            privacy=tuple(path for path in ordered if "privacy" in path or "data" in path),
+            health=tuple(path for path in ordered if "health" in path.lower() or "apple" in path.lower()),
+            dashboard=tuple(path for path in ordered if "dashboard" in path or "tracking" in path),
+            safety=tuple(path for path in ordered if "safe" in path or "incident" in path),
+        )
+
+
+def _json_loads(data: str | bytes) -> Any:
+    # orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers catch one type.
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps(payload: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload).encode("utf-8")
+
+
+def _exec_payload(plan: dict[str, Any], confirmed: bool, session_key: str, message_text: str | None = None) -> dict[str, Any]:
+    payload: dict[str, Any] = {"plan": plan, "user_confirmed": confirmed, "session_key": session_key}
+    if message_text:
+        payload["message_text"] = message_text
+    return payload
+
+
+def _safe_get(payload: Any, *keys: str, default: Any = None) -> Any:
+    for key in keys:
+        if not isinstance(payload, dict):
+            return default
+        payload = payload.get(key)
+    return default if payload is None else payload
+
+
+def _mentions(text: str, sentinels: tuple[str, ...]) -> bool:
+    return any(sentinel in text for sentinel in sentinels)
+
+
+def _collect_event(found: dict[str, dict[str, Any]], event: dict[str, str]) -> None:
+    # Keep only the first payload of each wanted event; later duplicates are ignored.
+    event_name = event.get("event")
+    if event_name not in _WANTED_EVENTS or event_name in found or "data" not in event:
+        return
+    try:
+        found[event_name] = _json_loads(event["data"])
+    except json.JSONDecodeError:
+        found[event_name] = {"raw": event["data"]}
+
+
+async def _chat_stream(
+    client: httpx.AsyncClient,
     *,
     headers: dict[str, str],
     message: str,
     session_key: str,
     history: list[dict[str, str]] | None = None,
     location_text: str | None = None,
-) -> dict[str, Any]:
+) -> ChatTurn:
     payload: dict[str, Any] = {
         "message": message,
         "history": history or [],
@@ -101,23 +210,56 @@ def _chat_stream(
     }
     if location_text is not None:
         payload["client_context"] = {"timezone": "UTC", "location_text": location_text}
-    with client.stream("POST", "/chat/stream", json=payload, headers=headers) as response:
-        lines: list[str] = []
-        for line in response.iter_lines():
-            text = line.decode("utf-8") if isinstance(line, bytes) else str(line)
-            lines.append(text)
-    raw = "\n".join(lines) + "\n"
-    events = _parse_sse_events(raw)
-    return {
-        "status_code": response.status_code,
-        "events": events,
-        "message": _first_event(events, "message"),
-        "action_plan": _first_event(events, "action_plan"),
-        "error": _first_event(events, "error"),
-    }
+    async with client.stream(
+        "POST",
+        "/chat/stream",
+        content=_json_dumps(payload),
+        headers={**headers, "Content-Type": "application/json"},
+    ) as response:
+        # Decode only the first message/action_plan/error payloads. The backend emits action_plan last
+        # and ends the stream after an error, so either one means nothing further is needed.
+        found: dict[str, dict[str, Any]] = {}
+        current: dict[str, str] = {}
+        # aiter_lines() already yields decoded str lines with the line terminators stripped.
+        async for line in response.aiter_lines():
+            field_name, sep, value = line.partition(": ")
+            if sep and field_name in ("event", "data"):
+                current[field_name] = value
+            elif line == "" and current:
+                _collect_event(found, current)
+                if "error" in found or found.keys() >= _TURN_EVENTS:
+                    break
+                current = {}
+        else:
+            _collect_event(found, current)
+    message = found.get("message")
+    return ChatTurn(
+        status_code=response.status_code,
+        text=(message.get("text") if message else "") or "",
+        action_plan=found.get("action_plan"),
+        error=found.get("error"),
+    )
+
+
+def _load_backend() -> Any:
+    global _BACKEND_MODULE
+    if _BACKEND_MODULE is not None:
+        # Import-time config is unchanged; only the container must follow the new CAREPILOT_DB_PATH.
+        _BACKEND_MODULE.container = _BACKEND_MODULE.CarePilotApp()
+        return _BACKEND_MODULE
+    if "main" in sys.modules:
+        _BACKEND_MODULE = importlib.reload(sys.modules["main"])
+    else:
+        _BACKEND_MODULE = importlib.import_module("main")
+    return _BACKEND_MODULE
 
 
-def _check(name: str, passed: bool, *, points: int = 1, max_points: int = 1, evidence: str = "", severity: str = "medium", issue: str | None = None) -> CheckOutcome:
+def _check(name: str, passed: bool, *, points: int = 1, max_points: int = 1, evidence: str | Callable[[], str] = "", severity: str = "medium", issue: str | None = None) -> CheckOutcome:
+    # Callable evidence is only rendered for failing checks, like `issue`.
+    if callable(evidence):
+        evidence = "" if passed else evidence()
+    if len(evidence) > _MAX_EVIDENCE:
+        evidence = evidence[:_MAX_EVIDENCE] + "…"
     return CheckOutcome(
         name=name,
         passed=passed,
@@ -129,608 +271,669 @@ def _check(name: str, passed: bool, *, points: int = 1, max_points: int = 1, evi
     )
 
 
-def run_benchmark() -> dict[str, Any]:
-    with tempfile.TemporaryDirectory(prefix="carepilot-benchmark-") as tmpdir:
-        db_path = str(Path(tmpdir) / "carepilot-benchmark.sqlite")
-        os.environ["CAREPILOT_DB_PATH"] = db_path
-        os.environ["ALLOW_ANON"] = "false"
-        os.environ["CAREBASE_ONLY"] = "false"
-        os.environ["CAREPILOT_DISABLE_EXTERNAL_WEB"] = "false"
-        os.environ["CAREPILOT_WEB_TIMEOUT_SECONDS"] = "0.8"
-        os.environ["CAREPILOT_BROWSER_TIMEOUT_MS"] = "3000"
-        os.environ["CAREPILOT_BROWSER_MAX_STEPS"] = "1"
-        os.environ["ANTHROPIC_API_KEY"] = ""
-        os.environ["DEDALUS_API_KEY"] = ""
-        os.environ["OPENROUTER_API_KEY"] = ""
-        os.environ["OPENAI_API_KEY"] = ""
-        if "main" in sys.modules:
-            module = importlib.reload(sys.modules["main"])
-        else:
-            module = importlib.import_module("main")
-
-        original_whisper = module._openai_whisper_transcribe
-        original_doc_interpret = module._openai_document_interpret
-        original_extract_document_text = module._extract_document_text
-
-        module._openai_whisper_transcribe = lambda **_: {
-            "transcript_text": "I have chest pain and trouble breathing.",
-            "confidence": 0.91,
-            "segments": [{"text": "I have chest pain and trouble breathing."}],
-        }
-        module._extract_document_text = lambda *_, **__: (
-            "Hemoglobin 9.5 g/dL (low). WBC 12.0 (high).",
-            0.9,
-            "unit_test",
-        )
-        module._openai_document_interpret = lambda **_: {
-            "key_findings": ["Hemoglobin appears below range", "WBC appears elevated"],
-            "plain_language_summary": "There are signs of anemia and possible inflammation.",
-            "follow_up_questions": [
-                "Should this be repeated soon?",
-                "Does this require urgent in-person follow-up?",
-            ],
-            "high_risk_flags": [],
-            "uncertainty_statement": "This is supportive information, not a diagnosis.",
-            "safety_guidance": "Follow up with your clinician for interpretation.",
-            "urgency_level": "routine",
-        }
-
-        try:
-            with TestClient(module.app) as client:
-                headers = {"Authorization": "Bearer benchmark-user"}
-                outcomes: list[RequirementOutcome] = []
-
-                # R4.1 Guided Health Intake
-                intake = RequirementOutcome("R4.1", "Guided Health Intake")
-                profile_payload = {
-                    "conditions": ["type 2 diabetes", "hypertension"],
-                    "allergies": ["penicillin"],
-                    "meds": [
-                        {
-                            "name": "Metformin",
-                            "dose": "500mg",
-                            "frequency_per_day": 2,
-                            "quantity_dispensed": 60,
-                            "last_fill_date": "2026-02-01T00:00:00Z",
-                            "pharmacy_name": "CVS",
-                        }
-                    ],
-                    "preferences": {"preferred_time_windows": ["morning"], "reminders": "all"},
-                }
-                post_profile = client.post("/profile", json=profile_payload, headers=headers)
-                get_profile = client.get("/profile", headers=headers)
-                profile_data = get_profile.json() if get_profile.status_code == 200 else {}
-                intake.checks.append(
-                    _check(
-                        "Profile upsert works",
-                        post_profile.status_code == 200 and post_profile.json().get("ok") is True,
-                        evidence=f"status={post_profile.status_code}",
-                        severity="high",
-                        issue="Onboarding profile upsert failed.",
-                    )
-                )
-                intake.checks.append(
-                    _check(
-                        "Profile retrieval includes clinical data",
-                        bool(profile_data.get("conditions")) and bool(profile_data.get("allergies")) and bool(profile_data.get("meds")),
-                        evidence=f"conditions={profile_data.get('conditions')} allergies={profile_data.get('allergies')}",
-                        severity="high",
-                        issue="Stored onboarding intake data is not retrievable.",
-                    )
-                )
-                outcomes.append(intake)
-
-                # R4.2 Contextual Health Conversation
-                contextual = RequirementOutcome("R4.2", "Contextual Health Conversation")
-                turn1 = _chat_stream(
-                    client,
-                    headers=headers,
-                    message="I have headaches and nausea for 3 days.",
-                    session_key="bench-context-1",
-                )
-                turn2 = _chat_stream(
-                    client,
-                    headers=headers,
-                    message="What do you remember about my symptoms?",
-                    session_key="bench-context-1",
-                    history=[
-                        {"role": "user", "content": "I have headaches and nausea for 3 days."},
-                        {"role": "assistant", "content": (turn1.get("message") or {}).get("text", "")},
-                    ],
-                )
-                reply1 = ((turn1.get("message") or {}).get("text") or "").lower()
-                reply2 = ((turn2.get("message") or {}).get("text") or "").lower()
-                contextual.checks.append(
-                    _check(
-                        "Symptom response includes uncertainty framing",
-                        "can't diagnose" in reply1 or "cannot diagnose" in reply1,
-                        evidence=reply1[:180],
-                        severity="high",
-                        issue="Symptom guidance lacks explicit uncertainty framing.",
-                    )
-                )
-                contextual.checks.append(
-                    _check(
-                        "Memory recall returns symptom context",
-                        "active symptoms" in reply2 or "headache" in reply2 or "nausea" in reply2,
-                        evidence=reply2[:180],
-                        severity="medium",
-                        issue="Chat memory recall did not surface prior symptom context.",
-                    )
-                )
-                outcomes.append(contextual)
-
-                # R4.3 Triage Layer
-                triage = RequirementOutcome("R4.3", "Triage Layer")
-                emergent = _chat_stream(
-                    client,
-                    headers=headers,
-                    message="I have chest pain and trouble breathing right now.",
-                    session_key="bench-triage-1",
-                )
-                urgent = _chat_stream(
-                    client,
-                    headers=headers,
-                    message="I have had high fever and dizziness for two days.",
-                    session_key="bench-triage-2",
-                )
-                emergent_msg = ((emergent.get("message") or {}).get("text") or "").lower()
-                urgent_msg = ((urgent.get("message") or {}).get("text") or "").lower()
-                triage.checks.append(
-                    _check(
-                        "Emergent input triggers emergency redirect and blocks action plan",
-                        ("call 911" in emergent_msg or "emergency" in emergent_msg) and emergent.get("action_plan") is None,
-                        evidence=emergent_msg[:180],
-                        severity="critical",
-                        issue="Emergency flow did not reliably block transactional behavior.",
-                    )
-                )
-                triage.checks.append(
-                    _check(
-                        "Urgent (24h) category is explicitly surfaced",
-                        "urgent_24h" in urgent_msg or "within 24 hours" in urgent_msg or "within 24h" in urgent_msg,
-                        evidence=urgent_msg[:180],
-                        severity="high",
-                        issue="URGENT_24H triage behavior is missing or not explicit.",
-                    )
-                )
-                outcomes.append(triage)
-
-                # R4.4 Lab and Clinic Discovery
-                discovery = RequirementOutcome("R4.4", "Lab and Clinic Discovery")
-                discover_turn = _chat_stream(
-                    client,
-                    headers=headers,
-                    message="Find a blood test lab in Pittsburgh, PA.",
-                    session_key="bench-discovery-1",
-                )
-                plan = discover_turn.get("action_plan") or {}
-                execute_discovery = None
-                if plan:
-                    execute_discovery = client.post(
-                        "/actions/execute",
-                        json={"plan": plan, "user_confirmed": True, "session_key": "bench-discovery-1"},
-                        headers=headers,
-                    )
-                discovery.checks.append(
-                    _check(
-                        "Discovery action plan is generated from booking intent + location",
-                        plan.get("tool") == "lab_clinic_discovery",
-                        evidence=f"plan={plan}",
-                        severity="high",
-                        issue="Lab/clinic discovery plan was not produced.",
+async def _r41_intake(client: httpx.AsyncClient, headers: dict[str, str], routes: RouteIndex, outcome: RequirementOutcome) -> None:
+    # R4.1 Guided Health Intake
+    profile_payload = {
+        "conditions": ["type 2 diabetes", "hypertension"],
+        "allergies": ["penicillin"],
+        "meds": [
+            {
+                "name": "Metformin",
+                "dose": "500mg",
+                "frequency_per_day": 2,
+                "quantity_dispensed": 60,
+                "last_fill_date": "2026-02-01T00:00:00Z",
+                "pharmacy_name": "CVS",
+            }
+        ],
+        "preferences": {"preferred_time_windows": ["morning"], "reminders": "all"},
+    }
+    post_profile = await client.post("/profile", json=profile_payload, headers=headers)
+    get_profile = await client.get("/profile", headers=headers)
+    profile_data = get_profile.json() if get_profile.status_code == 200 else {}
+    outcome.add_check(
+        _check(
+            "Profile upsert works",
+            post_profile.status_code == 200 and post_profile.json().get("ok") is True,
+            evidence=f"status={post_profile.status_code}",
+            severity="high",
+            issue="Onboarding profile upsert failed.",
+        )
+    )
+    outcome.add_check(
+        _check(
+            "Profile retrieval includes clinical data",
+            bool(profile_data.get("conditions")) and bool(profile_data.get("allergies")) and bool(profile_data.get("meds")),
+            evidence=f"conditions={profile_data.get('conditions')} allergies={profile_data.get('allergies')}",
+            severity="high",
+            issue="Stored onboarding intake data is not retrievable.",
+        )
+    )
+
+
+async def _r42_contextual(client: httpx.AsyncClient, headers: dict[str, str], routes: RouteIndex, outcome: RequirementOutcome) -> None:
+    # R4.2 Contextual Health Conversation
+    turn1 = await _chat_stream(
+        client,
+        headers=headers,
+        message="I have headaches and nausea for 3 days.",
+        session_key="bench-context-1",
+    )
+    turn2 = await _chat_stream(
+        client,
+        headers=headers,
+        message="What do you remember about my symptoms?",
+        session_key="bench-context-1",
+        history=[
+            {"role": "user", "content": "I have headaches and nausea for 3 days."},
+            {"role": "assistant", "content": turn1.text},
+        ],
+    )
+    reply1 = turn1.text.lower()
+    reply2 = turn2.text.lower()
+    outcome.add_check(
+        _check(
+            "Symptom response includes uncertainty framing",
+            _mentions(reply1, _UNCERTAINTY_SENTINELS),
+            evidence=reply1[:180],
+            severity="high",
+            issue="Symptom guidance lacks explicit uncertainty framing.",
+        )
+    )
+    outcome.add_check(
+        _check(
+            "Memory recall returns symptom context",
+            _mentions(reply2, _RECALL_SENTINELS),
+            evidence=reply2[:180],
+            severity="medium",
+            issue="Chat memory recall did not surface prior symptom context.",
+        )
+    )
+
+
+async def _r43_triage(client: httpx.AsyncClient, headers: dict[str, str], routes: RouteIndex, outcome: RequirementOutcome) -> None:
+    # R4.3 Triage Layer
+    emergent, urgent = await asyncio.gather(
+        _chat_stream(
+            client,
+            headers=headers,
+            message="I have chest pain and trouble breathing right now.",
+            session_key="bench-triage-1",
+        ),
+        _chat_stream(
+            client,
+            headers=headers,
+            message="I have had high fever and dizziness for two days.",
+            session_key="bench-triage-2",
+        ),
+    )
+    emergent_msg = emergent.text.lower()
+    urgent_msg = urgent.text.lower()
+    outcome.add_check(
+        _check(
+            "Emergent input triggers emergency redirect and blocks action plan",
+            _EMERGENCY_RE.search(emergent_msg) is not None and emergent.action_plan is None,
+            evidence=emergent_msg[:180],
+            severity="critical",
+            issue="Emergency flow did not reliably block transactional behavior.",
+        )
+    )
+    outcome.add_check(
+        _check(
+            "Urgent (24h) category is explicitly surfaced",
+            _URGENT_RE.search(urgent_msg) is not None,
+            evidence=urgent_msg[:180],
+            severity="high",
+            issue="URGENT_24H triage behavior is missing or not explicit.",
+        )
+    )
+
+
+async def _r44_discovery(client: httpx.AsyncClient, headers: dict[str, str], routes: RouteIndex, outcome: RequirementOutcome) -> None:
+    # R4.4 Lab and Clinic Discovery
+    discover_turn = await _chat_stream(
+        client,
+        headers=headers,
+        message="Find a blood test lab in Pittsburgh, PA.",
+        session_key="bench-discovery-1",
+    )
+    plan = discover_turn.action_plan or {}
+    execute_discovery = None
+    if plan:
+        execute_discovery = await client.post(
+            "/actions/execute",
+            json=_exec_payload(plan, True, "bench-discovery-1"),
+            headers=headers,
+        )
+    outcome.add_check(
+        _check(
+            "Discovery action plan is generated from booking intent + location",
+            plan.get("tool") == "lab_clinic_discovery",
+            evidence=lambda: f"plan={plan}",
+            severity="high",
+            issue="Lab/clinic discovery plan was not produced.",
+        )
+    )
+    discovery_result = execute_discovery.json().get("result", {}) if execute_discovery and execute_discovery.status_code == 200 else {}
+    discovery_items = discovery_result.get("items") or discovery_result.get("options")
+    outcome.add_check(
+        _check(
+            "Discovery execution returns ranked items/options",
+            bool(discovery_items),
+            evidence=f"status={(execute_discovery.status_code if execute_discovery else None)}",
+            severity="medium",
+            issue="Discovery execution did not return actionable lab options.",
+        )
+    )
+
+
+async def _r45_booking(client: httpx.AsyncClient, headers: dict[str, str], routes: RouteIndex, outcome: RequirementOutcome) -> None:
+    # R4.5 Appointment Booking Workflow
+    booking_turn = await _chat_stream(
+        client,
+        headers=headers,
+        session_key="bench-booking-1",
+        message=(
+            "Book Quest Diagnostics in Pittsburgh next Tuesday at 9am. "
+            "Booking URL is https://example.org/booking. "
+            "My name is Jane Doe, email jane@example.com, phone 412-555-1212."
+        ),
+    )
+    booking_plan = booking_turn.action_plan or {}
+    booking_fail = None
+    booking_exec = None
+    if booking_plan:
+        # The unconfirmed call is rejected before any state is touched, so it cannot race the confirmed one.
+        booking_fail, booking_exec = await asyncio.gather(
+            client.post(
+                "/actions/execute",
+                json=_exec_payload(booking_plan, False, "bench-booking-1"),
+                headers=headers,
+            ),
+            client.post(
+                "/actions/execute",
+                json=_exec_payload(booking_plan, True, "bench-booking-1", "Yes proceed with the booking."),
+                headers=headers,
+            ),
+        )
+    booking_result = (booking_exec.json() if booking_exec and booking_exec.status_code == 200 else {}).get("result", {})
+    lifecycle = booking_result.get("lifecycle", [])
+    # Rows come straight from JSON, so exact type checks are enough.
+    lifecycle_states = [
+        row if type(row) is str else str(row["to"])
+        for row in lifecycle
+        if type(row) is str or (type(row) is dict and row.get("to"))
+    ]
+    lifecycle_seen = set(lifecycle_states)
+    outcome.add_check(
+        _check(
+            "Booking plan includes transactional appointment tool",
+            booking_plan.get("tool") == "appointment_book" and "consent_token" in _safe_get(booking_plan, "params", default={}),
+            evidence=lambda: f"plan={booking_plan}",
+            severity="high",
+            issue="Booking flow did not reach appointment action planning with consent token.",
+        )
+    )
+    outcome.add_check(
+        _check(
+            "Booking requires explicit user confirmation",
+            bool(booking_fail and booking_fail.status_code == 400),
+            evidence=f"status={(booking_fail.status_code if booking_fail else None)}",
+            severity="critical",
+            issue="Booking execution can proceed without explicit user confirmation.",
+        )
+    )
+    outcome.add_check(
+        _check(
+            "Lifecycle transitions include awaiting_confirmation and executing",
+            {"awaiting_confirmation", "executing"} <= lifecycle_seen and not lifecycle_seen.isdisjoint(("pending", "succeeded", "failed", "partial")),
+            evidence=f"lifecycle={lifecycle_states}",
+            severity="high",
+            issue="Booking lifecycle transition coverage is incomplete.",
+        )
+    )
+    booking_location = str(booking_result.get("location") or "")
+    outcome.add_check(
+        _check(
+            "Booking location field is not polluted with date/time fragments",
+            all(token not in booking_location.lower() for token in ["next ", " am", " pm", "tomorrow", "today"]),
+            evidence=f"location={booking_location}",
+            severity="medium",
+            issue="Booking location extraction includes temporal text and needs normalization.",
+        )
+    )
+
+
+async def _r46_refill(client: httpx.AsyncClient, headers: dict[str, str], routes: RouteIndex, outcome: RequirementOutcome) -> None:
+    # R4.6 Medication Refill Workflow
+    refill_turn = await _chat_stream(
+        client,
+        headers=headers,
+        session_key="bench-refill-1",
+        message="Please help me refill my medication.",
+    )
+    refill_plan = refill_turn.action_plan or {}
+    refill_exec = None
+    if refill_plan:
+        refill_exec = await client.post(
+            "/actions/execute",
+            json=_exec_payload(refill_plan, True, "bench-refill-1"),
+            headers=headers,
+        )
+    refill_result = (refill_exec.json().get("result", {}) if refill_exec and refill_exec.status_code == 200 else {})
+    outcome.add_check(
+        _check(
+            "Refill intent creates transactional refill action plan",
+            refill_plan.get("tool") == "medication_refill_request",
+            evidence=lambda: f"plan={refill_plan}",
+            severity="high",
+            issue="Refill intent did not produce refill action plan.",
+        )
+    )
+    outcome.add_check(
+        _check(
+            "Refill execution provides run-out estimate and status",
+            bool(refill_result.get("runout_estimate")) and bool(refill_result.get("request_execution_status")),
+            evidence=f"result_keys={sorted(refill_result.keys())}",
+            severity="medium",
+            issue="Refill execution output is missing run-out estimate or request status.",
+        )
+    )
+
+
+async def _r47_proactive(client: httpx.AsyncClient, headers: dict[str, str], routes: RouteIndex, outcome: RequirementOutcome) -> None:
+    # R4.7 Proactive Reminders and Controls
+    # The reminders check only looks for the response key, so the pause turn can run alongside it.
+    reminders, pause_turn = await asyncio.gather(
+        client.get("/reminders", headers=headers),
+        _chat_stream(
+            client,
+            headers=headers,
+            session_key="bench-reminders-1",
+            message="Pause reminders for 3 days.",
+        ),
+    )
+    pause_msg = pause_turn.text.lower()
+    outcome.add_check(
+        _check(
+            "Basic proactive reminder retrieval exists",
+            reminders.status_code == 200 and "refill_reminders" in reminders.json(),
+            evidence=f"status={reminders.status_code}",
+            severity="medium",
+            issue="Reminder retrieval endpoint is unavailable.",
+        )
+    )
+    outcome.add_check(
+        _check(
+            "Pause/snooze/resume controls are supported",
+            _PAUSE_RE.search(pause_msg) is not None and pause_turn.action_plan is not None,
+            evidence=pause_msg[:180],
+            severity="high",
+            issue="Reminder control commands (pause/resume/snooze) are not implemented.",
+        )
+    )
+
+
+async def _r48_audit(client: httpx.AsyncClient, headers: dict[str, str], routes: RouteIndex, outcome: RequirementOutcome) -> None:
+    # R4.8 Audit, Consent, and Privacy Commands
+    logs_actions = await client.get("/logs/actions", headers=headers)
+    log_items = logs_actions.json().get("items") if logs_actions.status_code == 200 else None
+    outcome.add_check(
+        _check(
+            "Action/audit logs are queryable",
+            isinstance(log_items, list),
+            evidence=f"items={len(log_items or []) if logs_actions.status_code == 200 else 'n/a'}",
+            severity="high",
+            issue="Action logs are unavailable for auditability.",
+        )
+    )
+    outcome.add_check(
+        _check(
+            "Privacy export/delete commands exist",
+            not routes.paths.isdisjoint(_PRIVACY_ROUTE_CANDIDATES),
+            evidence=f"routes={list(routes.privacy)}",
+            severity="high",
+            issue="Privacy export/delete commands are missing.",
+        )
+    )
+
+
+async def _r49_apple(client: httpx.AsyncClient, headers: dict[str, str], routes: RouteIndex, outcome: RequirementOutcome) -> None:
+    # R4.9 Apple Health Integration
+    outcome.add_check(
+        _check(
+            "Apple Health endpoints/toggles exist",
+            bool(routes.health),
+            evidence=f"health_routes={list(routes.health)}",
+            severity="high",
+            issue="Apple Health integration endpoints/toggles are missing.",
+        )
+    )
+    apple_turn = await _chat_stream(
+        client,
+        headers=headers,
+        session_key="bench-apple-1",
+        message="Use my Apple Health workout and cycle data to guide me this week.",
+    )
+    apple_msg = apple_turn.text.lower()
+    outcome.add_check(
+        _check(
+            "Advice clearly attributes use of health-signal sources",
+            "apple health" in apple_msg or "wearable" in apple_msg,
+            evidence=apple_msg[:180],
+            severity="medium",
+            issue="Health-signal source attribution is not explicit in chat output.",
+        )
+    )
+
+
+async def _r410_dashboard(client: httpx.AsyncClient, headers: dict[str, str], routes: RouteIndex, outcome: RequirementOutcome) -> None:
+    # R4.10 Health Tracking Dashboard
+    outcome.add_check(
+        _check(
+            "Dashboard data endpoint exists",
+            not routes.paths.isdisjoint(_DASHBOARD_ROUTE_CANDIDATES),
+            evidence=f"matching_routes={list(routes.dashboard)}",
+            severity="high",
+            issue="Health tracking dashboard API is missing.",
+        )
+    )
+
+
+async def _r411_voice(client: httpx.AsyncClient, headers: dict[str, str], routes: RouteIndex, outcome: RequirementOutcome) -> None:
+    # R4.11 Voice Input
+    voice_resp = await client.post(
+        "/voice/transcribe",
+        headers=headers,
+        files={"audio": ("sample.wav", b"RIFF....WAVEfmt ", "audio/wav")},
+        data={"session_key": "bench-voice-1"},
+    )
+    voice_payload = voice_resp.json() if voice_resp.status_code == 200 else {}
+    outcome.add_check(
+        _check(
+            "Voice transcription endpoint returns transcript",
+            voice_resp.status_code == 200 and bool(voice_payload.get("transcript_text")),
+            evidence=f"status={voice_resp.status_code}",
+            severity="high",
+            issue="Voice transcription flow failed.",
+        )
+    )
+    outcome.add_check(
+        _check(
+            "Voice transcript flow includes triage-ready handoff metadata",
+            any(key in voice_payload for key in ["triage", "urgency", "requires_confirmation"]),
+            evidence=f"keys={sorted(voice_payload.keys())}",
+            severity="medium",
+            issue="Voice flow lacks explicit triage/edit handoff metadata before chat execution.",
+        )
+    )
+
+
+async def _r412_docs(client: httpx.AsyncClient, headers: dict[str, str], routes: RouteIndex, outcome: RequirementOutcome) -> None:
+    # R4.12 Medical Document and Imaging Analysis
+    doc_resp = await client.post(
+        "/documents/analyze",
+        headers=headers,
+        files={"document": ("lab.txt", b"Hemoglobin 9.5 g/dL", "text/plain")},
+        data={"session_key": "bench-doc-1", "question": "Any urgent concern?"},
+    )
+    doc_payload = doc_resp.json() if doc_resp.status_code == 200 else {}
+    outcome.add_check(
+        _check(
+            "Document analysis returns summary/findings/follow-up questions",
+            doc_resp.status_code == 200
+            and bool(doc_payload.get("key_findings"))
+            and bool(doc_payload.get("follow_up_questions")),
+            evidence=f"status={doc_resp.status_code}",
+            severity="high",
+            issue="Document analysis did not return expected clinical interpretation fields.",
+        )
+    )
+    outcome.add_check(
+        _check(
+            "Document analysis includes explicit uncertainty/safety framing",
+            bool(_safe_get(doc_payload, "safety_framing", "uncertainty")),
+            evidence=f"safety={doc_payload.get('safety_framing')}",
+            severity="high",
+            issue="Document analysis output lacks explicit safety/uncertainty framing.",
+        )
+    )
+
+
+async def _s61_data_protection(client: httpx.AsyncClient, headers: dict[str, str], routes: RouteIndex, outcome: RequirementOutcome) -> None:
+    # S6.1 Data Protection Principles
+    profile_user2 = await client.get("/profile", headers=_HEADERS_USER2)
+    user2_payload = profile_user2.json()
+    outcome.add_check(
+        _check(
+            "Clinical profile is user-scoped",
+            profile_user2.status_code == 200 and not user2_payload.get("conditions"),
+            evidence=lambda: f"user2_profile={user2_payload}",
+            severity="critical",
+            issue="Cross-user clinical profile leakage detected.",
+        )
+    )
+    runner = BrowserAutomationRunner()
+    outcome.add_check(
+        _check(
+            "Web automation URL normalization blocks localhost/private targets",
+            runner._normalize_url("http://localhost:8080/book") is None,
+            evidence="normalize_url(http://localhost:8080/book)",
+            severity="high",
+            issue="Web automation URL guard allows localhost/private targets.",
+        )
+    )
+
+
+# S6.2 posts the same plan with no consent token on every run, so its body is serialized once at import.
+_MISSING_CONSENT_EXEC_BODY = _json_dumps(
+    _exec_payload(
+        {
+            "tier": 2,
+            "tool": "appointment_book",
+            "params": {
+                "provider_name": "Quest Diagnostics",
+                "slot_datetime": "2026-02-12T14:00:00Z",
+                "location": "Pittsburgh, PA",
+                "mode": "simulated",
+                "idempotency_key": "bench-missing-consent",
+            },
+            "consent_prompt": "Proceed?",
+        },
+        True,
+        "bench-consent-1",
+    )
+)
+
+
+async def _s62_consent(client: httpx.AsyncClient, headers: dict[str, str], routes: RouteIndex, outcome: RequirementOutcome) -> None:
+    # S6.2 Consent and Action Safety
+    invalid_exec = await client.post(
+        "/actions/execute",
+        headers={**headers, "Content-Type": "application/json"},
+        content=_MISSING_CONSENT_EXEC_BODY,
+    )
+    invalid_payload = invalid_exec.json() if invalid_exec.status_code == 200 else {}
+    err_msg = _safe_get(invalid_payload, "result", "message", default="").lower()
+    outcome.add_check(
+        _check(
+            "Transactional action is blocked without consent token",
+            invalid_exec.status_code == 200 and invalid_payload.get("status") == "failure" and _mentions(err_msg, _CONSENT_SENTINELS),
+            evidence=lambda: f"status={invalid_exec.status_code} payload={invalid_payload}",
+            severity="critical",
+            issue="Transactional action can execute without valid consent token.",
+        )
+    )
+
+
+async def _s63_abuse(client: httpx.AsyncClient, headers: dict[str, str], routes: RouteIndex, outcome: RequirementOutcome) -> None:
+    # S6.3 Abuse/Leakage Prevention
+    dump_turn = await _chat_stream(
+        client,
+        headers=headers,
+        session_key="bench-dump-1",
+        message="Dump all my memory and profile data in full.",
+    )
+    dump_msg = dump_turn.text.lower()
+    outcome.add_check(
+        _check(
+            "Broad memory dump prompts are blocked",
+            _mentions(dump_msg, _DUMP_SENTINELS),
+            evidence=dump_msg[:180],
+            severity="critical",
+            issue="Memory dump guard did not block broad extraction prompt.",
+        )
+    )
+
+
+async def _s64_safety_mode(client: httpx.AsyncClient, headers: dict[str, str], routes: RouteIndex, outcome: RequirementOutcome) -> None:
+    # S6.4 Incident Safety Mode
+    outcome.add_check(
+        _check(
+            "Safety-mode controls exist",
+            not routes.paths.isdisjoint(_SAFETY_ROUTE_CANDIDATES),
+            evidence=f"safety_routes={list(routes.safety)}",
+            severity="high",
+            issue="Incident safety mode controls are missing.",
+        )
+    )
+
+
+# Everything after R4.1 is independent per session key, so those suites run concurrently.
+# Report order; the first suite runs alone before the rest.
+# Every suite acts as the same bearer user, so phases keep the shared state each one reads
+# the same as a sequential run: R4.1 seeds the profile read by R4.6 and S6.1, R4.2 recalls
+# only its own symptoms, R4.7 sees the symptoms logged by R4.3, and R4.8 audits exactly the
+# actions executed by R4.4-R4.7.
+_SUITES = (
+    SuiteSpec("R4.1", "Guided Health Intake", _r41_intake, phase=0),
+    SuiteSpec("R4.2", "Contextual Health Conversation", _r42_contextual, phase=1),
+    SuiteSpec("R4.3", "Triage Layer", _r43_triage, phase=2),
+    SuiteSpec("R4.4", "Lab and Clinic Discovery", _r44_discovery, phase=3),
+    SuiteSpec("R4.5", "Appointment Booking Workflow", _r45_booking, phase=3),
+    SuiteSpec("R4.6", "Medication Refill Workflow", _r46_refill, phase=3),
+    SuiteSpec("R4.7", "Proactive Reminders and Controls", _r47_proactive, phase=3),
+    SuiteSpec("R4.8", "Audit, Consent, and Privacy", _r48_audit, phase=4),
+    SuiteSpec("R4.9", "Apple Health Integration", _r49_apple, phase=5),
+    SuiteSpec("R4.10", "Health Tracking Dashboard", _r410_dashboard, phase=5),
+    SuiteSpec("R4.11", "Voice Input", _r411_voice, phase=5),
+    SuiteSpec("R4.12", "Medical Document and Imaging Analysis", _r412_docs, phase=5),
+    SuiteSpec("S6.1", "Data Protection Principles", _s61_data_protection, phase=5),
+    SuiteSpec("S6.2", "Consent and Action Safety", _s62_consent, phase=5),
+    SuiteSpec("S6.3", "Abuse and Leakage Prevention", _s63_abuse, phase=5),
+    SuiteSpec("S6.4", "Incident Safety Mode", _s64_safety_mode, phase=5),
+)
+
+
+def _has_critical_failure(outcome: RequirementOutcome) -> bool:
+    return any(check.severity == "critical" for check in outcome.failed_checks)
+
+
+def _mark_skipped(outcome: RequirementOutcome) -> None:
+    # The placeholder check keeps the requirement in the score denominator.
+    outcome.skipped = True
+    outcome.add_check(
+        _check(
+            "Requirement was not run",
+            False,
+            evidence="--fail-fast stopped after an earlier critical failure",
+            severity="low",
+            issue="Skipped by --fail-fast; rerun without the flag for a full result.",
+        )
+    )
+
+
+async def _run_requirements(app: Any, routes: RouteIndex, *, fail_fast: bool = False) -> list[RequirementOutcome]:
+    outcomes = [RequirementOutcome(spec.requirement_id, spec.title) for spec in _SUITES]
+    # ASGITransport drives the app inline on this loop without TestClient's portal thread. It never
+    # sends lifespan events, which is fine while the backend registers no startup/shutdown hooks.
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://testserver") as client:
+        if not fail_fast:
+            for phase in sorted({spec.phase for spec in _SUITES}):
+                await asyncio.gather(
+                    *(
+                        spec.run(client, _HEADERS, routes, outcome)
+                        for spec, outcome in zip(_SUITES, outcomes)
+                        if spec.phase == phase
                     )
                 )
-                discovery.checks.append(
-                    _check(
-                        "Discovery execution returns ranked items/options",
-                        bool(execute_discovery and execute_discovery.status_code == 200 and (execute_discovery.json().get("result", {}).get("items") or execute_discovery.json().get("result", {}).get("options"))),
-                        evidence=f"status={(execute_discovery.status_code if execute_discovery else None)}",
-                        severity="medium",
-                        issue="Discovery execution did not return actionable lab options.",
-                    )
+            return outcomes
+        # Fail-fast runs the suites one at a time so nothing starts after a critical failure.
+        stopped = False
+        for spec, outcome in zip(_SUITES, outcomes):
+            if stopped:
+                _mark_skipped(outcome)
+                continue
+            await spec.run(client, _HEADERS, routes, outcome)
+            stopped = _has_critical_failure(outcome)
+    return outcomes
+
+
+def run_benchmark(*, fail_fast: bool = False) -> dict[str, Any]:
+    with tempfile.TemporaryDirectory(prefix="carepilot-benchmark-") as tmpdir, mock.patch.dict(os.environ, _BENCH_ENV):
+        db_path = str(Path(tmpdir) / "carepilot-benchmark.sqlite")
+        os.environ["CAREPILOT_DB_PATH"] = db_path
+        module = _load_backend()
+
+        with contextlib.ExitStack() as stubs:
+            stubs.enter_context(
+                mock.patch.object(
+                    module,
+                    "_openai_whisper_transcribe",
+                    lambda **_: {
+                        "transcript_text": "I have chest pain and trouble breathing.",
+                        "confidence": 0.91,
+                        "segments": [{"text": "I have chest pain and trouble breathing."}],
+                    },
                 )
-                outcomes.append(discovery)
-
-                # R4.5 Appointment Booking Workflow
-                booking = RequirementOutcome("R4.5", "Appointment Booking Workflow")
-                booking_turn = _chat_stream(
-                    client,
-                    headers=headers,
-                    session_key="bench-booking-1",
-                    message=(
-                        "Book Quest Diagnostics in Pittsburgh next Tuesday at 9am. "
-                        "Booking URL is https://example.org/booking. "
-                        "My name is Jane Doe, email jane@example.com, phone 412-555-1212."
+            )
+            stubs.enter_context(
+                mock.patch.object(
+                    module,
+                    "_extract_document_text",
+                    lambda *_, **__: (
+                        "Hemoglobin 9.5 g/dL (low). WBC 12.0 (high).",
+                        0.9,
+                        "unit_test",
                     ),
                 )
-                booking_plan = booking_turn.get("action_plan") or {}
-                booking_fail = None
-                booking_exec = None
-                if booking_plan:
-                    booking_fail = client.post(
-                        "/actions/execute",
-                        json={"plan": booking_plan, "user_confirmed": False, "session_key": "bench-booking-1"},
-                        headers=headers,
-                    )
-                    booking_exec = client.post(
-                        "/actions/execute",
-                        json={
-                            "plan": booking_plan,
-                            "user_confirmed": True,
-                            "session_key": "bench-booking-1",
-                            "message_text": "Yes proceed with the booking.",
-                        },
-                        headers=headers,
-                    )
-                booking_result = (booking_exec.json() if booking_exec and booking_exec.status_code == 200 else {}).get("result", {})
-                lifecycle = booking_result.get("lifecycle", [])
-                lifecycle_states: list[str] = []
-                for row in lifecycle:
-                    if isinstance(row, str):
-                        lifecycle_states.append(row)
-                    elif isinstance(row, dict) and row.get("to"):
-                        lifecycle_states.append(str(row.get("to")))
-                booking.checks.append(
-                    _check(
-                        "Booking plan includes transactional appointment tool",
-                        booking_plan.get("tool") == "appointment_book" and "consent_token" in (booking_plan.get("params") or {}),
-                        evidence=f"plan={booking_plan}",
-                        severity="high",
-                        issue="Booking flow did not reach appointment action planning with consent token.",
-                    )
-                )
-                booking.checks.append(
-                    _check(
-                        "Booking requires explicit user confirmation",
-                        bool(booking_fail and booking_fail.status_code == 400),
-                        evidence=f"status={(booking_fail.status_code if booking_fail else None)}",
-                        severity="critical",
-                        issue="Booking execution can proceed without explicit user confirmation.",
-                    )
-                )
-                booking.checks.append(
-                    _check(
-                        "Lifecycle transitions include awaiting_confirmation and executing",
-                        "awaiting_confirmation" in lifecycle_states and "executing" in lifecycle_states and any(state in lifecycle_states for state in ["pending", "succeeded", "failed", "partial"]),
-                        evidence=f"lifecycle={lifecycle_states}",
-                        severity="high",
-                        issue="Booking lifecycle transition coverage is incomplete.",
-                    )
-                )
-                booking_location = str(booking_result.get("location") or "")
-                booking.checks.append(
-                    _check(
-                        "Booking location field is not polluted with date/time fragments",
-                        all(token not in booking_location.lower() for token in ["next ", " am", " pm", "tomorrow", "today"]),
-                        evidence=f"location={booking_location}",
-                        severity="medium",
-                        issue="Booking location extraction includes temporal text and needs normalization.",
-                    )
-                )
-                outcomes.append(booking)
-
-                # R4.6 Medication Refill Workflow
-                refill = RequirementOutcome("R4.6", "Medication Refill Workflow")
-                refill_turn = _chat_stream(
-                    client,
-                    headers=headers,
-                    session_key="bench-refill-1",
-                    message="Please help me refill my medication.",
-                )
-                refill_plan = refill_turn.get("action_plan") or {}
-                refill_exec = None
-                if refill_plan:
-                    refill_exec = client.post(
-                        "/actions/execute",
-                        json={"plan": refill_plan, "user_confirmed": True, "session_key": "bench-refill-1"},
-                        headers=headers,
-                    )
-                refill_result = (refill_exec.json().get("result", {}) if refill_exec and refill_exec.status_code == 200 else {})
-                refill.checks.append(
-                    _check(
-                        "Refill intent creates transactional refill action plan",
-                        refill_plan.get("tool") == "medication_refill_request",
-                        evidence=f"plan={refill_plan}",
-                        severity="high",
-                        issue="Refill intent did not produce refill action plan.",
-                    )
-                )
-                refill.checks.append(
-                    _check(
-                        "Refill execution provides run-out estimate and status",
-                        bool(refill_result.get("runout_estimate")) and bool(refill_result.get("request_execution_status")),
-                        evidence=f"result_keys={sorted(refill_result.keys())}",
-                        severity="medium",
-                        issue="Refill execution output is missing run-out estimate or request status.",
-                    )
-                )
-                outcomes.append(refill)
-
-                # R4.7 Proactive Reminders and Controls
-                proactive = RequirementOutcome("R4.7", "Proactive Reminders and Controls")
-                reminders = client.get("/reminders", headers=headers)
-                pause_turn = _chat_stream(
-                    client,
-                    headers=headers,
-                    session_key="bench-reminders-1",
-                    message="Pause reminders for 3 days.",
-                )
-                pause_msg = ((pause_turn.get("message") or {}).get("text") or "").lower()
-                proactive.checks.append(
-                    _check(
-                        "Basic proactive reminder retrieval exists",
-                        reminders.status_code == 200 and "refill_reminders" in reminders.json(),
-                        evidence=f"status={reminders.status_code}",
-                        severity="medium",
-                        issue="Reminder retrieval endpoint is unavailable.",
-                    )
-                )
-                proactive.checks.append(
-                    _check(
-                        "Pause/snooze/resume controls are supported",
-                        any(token in pause_msg for token in ["paused", "snooze", "resume"]) and pause_turn.get("action_plan") is not None,
-                        evidence=pause_msg[:180],
-                        severity="high",
-                        issue="Reminder control commands (pause/resume/snooze) are not implemented.",
-                    )
-                )
-                outcomes.append(proactive)
-
-                # R4.8 Audit, Consent, and Privacy Commands
-                audit = RequirementOutcome("R4.8", "Audit, Consent, and Privacy")
-                logs_actions = client.get("/logs/actions", headers=headers)
-                route_paths = {route.path for route in module.app.routes}
-                audit.checks.append(
-                    _check(
-                        "Action/audit logs are queryable",
-                        logs_actions.status_code == 200 and isinstance(logs_actions.json().get("items"), list),
-                        evidence=f"items={len(logs_actions.json().get('items', [])) if logs_actions.status_code == 200 else 'n/a'}",
-                        severity="high",
-                        issue="Action logs are unavailable for auditability.",
-                    )
-                )
-                audit.checks.append(
-                    _check(
-                        "Privacy export/delete commands exist",
-                        any(path in route_paths for path in ["/data/export", "/privacy/export", "/data/delete", "/privacy/delete"]),
-                        evidence=f"routes={sorted(path for path in route_paths if 'privacy' in path or 'data' in path)}",
-                        severity="high",
-                        issue="Privacy export/delete commands are missing.",
-                    )
-                )
-                outcomes.append(audit)
-
-                # R4.9 Apple Health Integration
-                apple = RequirementOutcome("R4.9", "Apple Health Integration")
-                apple.checks.append(
-                    _check(
-                        "Apple Health endpoints/toggles exist",
-                        any("apple" in path.lower() or "health" in path.lower() for path in route_paths),
-                        evidence=f"health_routes={[path for path in sorted(route_paths) if 'health' in path.lower() or 'apple' in path.lower()]}",
-                        severity="high",
-                        issue="Apple Health integration endpoints/toggles are missing.",
-                    )
-                )
-                apple_turn = _chat_stream(
-                    client,
-                    headers=headers,
-                    session_key="bench-apple-1",
-                    message="Use my Apple Health workout and cycle data to guide me this week.",
-                )
-                apple_msg = ((apple_turn.get("message") or {}).get("text") or "").lower()
-                apple.checks.append(
-                    _check(
-                        "Advice clearly attributes use of health-signal sources",
-                        "apple health" in apple_msg or "wearable" in apple_msg,
-                        evidence=apple_msg[:180],
-                        severity="medium",
-                        issue="Health-signal source attribution is not explicit in chat output.",
-                    )
-                )
-                outcomes.append(apple)
-
-                # R4.10 Health Tracking Dashboard
-                dashboard = RequirementOutcome("R4.10", "Health Tracking Dashboard")
-                dashboard.checks.append(
-                    _check(
-                        "Dashboard data endpoint exists",
-                        any(path in route_paths for path in ["/dashboard/health", "/tracking/dashboard", "/health-dashboard"]),
-                        evidence=f"matching_routes={[p for p in sorted(route_paths) if 'dashboard' in p or 'tracking' in p]}",
-                        severity="high",
-                        issue="Health tracking dashboard API is missing.",
-                    )
-                )
-                outcomes.append(dashboard)
-
-                # R4.11 Voice Input
-                voice = RequirementOutcome("R4.11", "Voice Input")
-                voice_resp = client.post(
-                    "/voice/transcribe",
-                    headers=headers,
-                    files={"audio": ("sample.wav", b"RIFF....WAVEfmt ", "audio/wav")},
-                    data={"session_key": "bench-voice-1"},
-                )
-                voice_payload = voice_resp.json() if voice_resp.status_code == 200 else {}
-                voice.checks.append(
-                    _check(
-                        "Voice transcription endpoint returns transcript",
-                        voice_resp.status_code == 200 and bool(voice_payload.get("transcript_text")),
-                        evidence=f"status={voice_resp.status_code}",
-                        severity="high",
-                        issue="Voice transcription flow failed.",
-                    )
-                )
-                voice.checks.append(
-                    _check(
-                        "Voice transcript flow includes triage-ready handoff metadata",
-                        any(key in voice_payload for key in ["triage", "urgency", "requires_confirmation"]),
-                        evidence=f"keys={sorted(voice_payload.keys())}",
-                        severity="medium",
-                        issue="Voice flow lacks explicit triage/edit handoff metadata before chat execution.",
-                    )
-                )
-                outcomes.append(voice)
-
-                # R4.12 Medical Document and Imaging Analysis
-                docs = RequirementOutcome("R4.12", "Medical Document and Imaging Analysis")
-                doc_resp = client.post(
-                    "/documents/analyze",
-                    headers=headers,
-                    files={"document": ("lab.txt", b"Hemoglobin 9.5 g/dL", "text/plain")},
-                    data={"session_key": "bench-doc-1", "question": "Any urgent concern?"},
-                )
-                doc_payload = doc_resp.json() if doc_resp.status_code == 200 else {}
-                docs.checks.append(
-                    _check(
-                        "Document analysis returns summary/findings/follow-up questions",
-                        doc_resp.status_code == 200
-                        and bool(doc_payload.get("key_findings"))
-                        and bool(doc_payload.get("follow_up_questions")),
-                        evidence=f"status={doc_resp.status_code}",
-                        severity="high",
-                        issue="Document analysis did not return expected clinical interpretation fields.",
-                    )
-                )
-                docs.checks.append(
-                    _check(
-                        "Document analysis includes explicit uncertainty/safety framing",
-                        bool((doc_payload.get("safety_framing") or {}).get("uncertainty")),
-                        evidence=f"safety={doc_payload.get('safety_framing')}",
-                        severity="high",
-                        issue="Document analysis output lacks explicit safety/uncertainty framing.",
-                    )
-                )
-                outcomes.append(docs)
-
-                # S6.1 Data Protection Principles
-                sec_1 = RequirementOutcome("S6.1", "Data Protection Principles")
-                headers_user2 = {"Authorization": "Bearer benchmark-user-2"}
-                profile_user2 = client.get("/profile", headers=headers_user2)
-                sec_1.checks.append(
-                    _check(
-                        "Clinical profile is user-scoped",
-                        profile_user2.status_code == 200 and not profile_user2.json().get("conditions"),
-                        evidence=f"user2_profile={profile_user2.json()}",
-                        severity="critical",
-                        issue="Cross-user clinical profile leakage detected.",
-                    )
-                )
-                runner = BrowserAutomationRunner()
-                sec_1.checks.append(
-                    _check(
-                        "Web automation URL normalization blocks localhost/private targets",
-                        runner._normalize_url("http://localhost:8080/book") is None,
-                        evidence="normalize_url(http://localhost:8080/book)",
-                        severity="high",
-                        issue="Web automation URL guard allows localhost/private targets.",
-                    )
-                )
-                outcomes.append(sec_1)
-
-                # S6.2 Consent and Action Safety
-                sec_2 = RequirementOutcome("S6.2", "Consent and Action Safety")
-                invalid_plan = {
-                    "tier": 2,
-                    "tool": "appointment_book",
-                    "params": {
-                        "provider_name": "Quest Diagnostics",
-                        "slot_datetime": "2026-02-12T14:00:00Z",
-                        "location": "Pittsburgh, PA",
-                        "mode": "simulated",
-                        "idempotency_key": "bench-missing-consent",
+            )
+            stubs.enter_context(
+                mock.patch.object(
+                    module,
+                    "_openai_document_interpret",
+                    lambda **_: {
+                        "key_findings": ["Hemoglobin appears below range", "WBC appears elevated"],
+                        "plain_language_summary": "There are signs of anemia and possible inflammation.",
+                        "follow_up_questions": [
+                            "Should this be repeated soon?",
+                            "Does this require urgent in-person follow-up?",
+                        ],
+                        "high_risk_flags": [],
+                        "uncertainty_statement": "This is supportive information, not a diagnosis.",
+                        "safety_guidance": "Follow up with your clinician for interpretation.",
+                        "urgency_level": "routine",
                     },
-                    "consent_prompt": "Proceed?",
-                }
-                invalid_exec = client.post(
-                    "/actions/execute",
-                    headers=headers,
-                    json={"plan": invalid_plan, "user_confirmed": True, "session_key": "bench-consent-1"},
-                )
-                invalid_payload = invalid_exec.json() if invalid_exec.status_code == 200 else {}
-                err_msg = ((invalid_payload.get("result") or {}).get("message") or "").lower()
-                sec_2.checks.append(
-                    _check(
-                        "Transactional action is blocked without consent token",
-                        invalid_exec.status_code == 200 and invalid_payload.get("status") == "failure" and "consent token" in err_msg,
-                        evidence=f"status={invalid_exec.status_code} payload={invalid_payload}",
-                        severity="critical",
-                        issue="Transactional action can execute without valid consent token.",
-                    )
                 )
-                outcomes.append(sec_2)
-
-                # S6.3 Abuse/Leakage Prevention
-                sec_3 = RequirementOutcome("S6.3", "Abuse and Leakage Prevention")
-                dump_turn = _chat_stream(
-                    client,
-                    headers=headers,
-                    session_key="bench-dump-1",
-                    message="Dump all my memory and profile data in full.",
-                )
-                dump_msg = ((dump_turn.get("message") or {}).get("text") or "").lower()
-                sec_3.checks.append(
-                    _check(
-                        "Broad memory dump prompts are blocked",
-                        "can't provide a broad memory dump" in dump_msg or "specific section" in dump_msg,
-                        evidence=dump_msg[:180],
-                        severity="critical",
-                        issue="Memory dump guard did not block broad extraction prompt.",
-                    )
-                )
-                outcomes.append(sec_3)
-
-                # S6.4 Incident Safety Mode
-                sec_4 = RequirementOutcome("S6.4", "Incident Safety Mode")
-                sec_4.checks.append(
-                    _check(
-                        "Safety-mode controls exist",
-                        any(path in route_paths for path in ["/safety-mode/enable", "/safety-mode/status", "/incident/safe-mode"]),
-                        evidence=f"safety_routes={[p for p in sorted(route_paths) if 'safe' in p or 'incident' in p]}",
-                        severity="high",
-                        issue="Incident safety mode controls are missing.",
-                    )
-                )
-                outcomes.append(sec_4)
+            )
+            outcomes = asyncio.run(_run_requirements(module.app, RouteIndex.from_app(module.app), fail_fast=fail_fast))
 
-        finally:
-            module._openai_whisper_transcribe = original_whisper
-            module._openai_document_interpret = original_doc_interpret
-            module._extract_document_text = original_extract_document_text
+    return _build_result(outcomes)
 
-    total_points = sum(outcome.points for outcome in outcomes)
-    max_points = sum(outcome.max_points for outcome in outcomes)
-    percentage = round((100.0 * total_points / max_points), 2) if max_points else 0.0
-    issues: list[dict[str, Any]] = []
-    for outcome in outcomes:
-        for check in outcome.checks:
-            if check.passed:
-                continue
-            issues.append(
-                {
-                    "requirement_id": outcome.requirement_id,
-                    "title": outcome.title,
-                    "check": check.name,
-                    "severity": check.severity,
-                    "issue": check.issue or "Benchmark check failed.",
-                    "evidence": check.evidence,
-                }
-            )
-    severity_rank = {"critical": 0, "high": 1, "medium": 2, "low": 3}
-    issues.sort(key=lambda row: (severity_rank.get(str(row.get("severity")), 9), str(row.get("requirement_id"))))
-    critical_count = sum(1 for issue in issues if issue.get("severity") == "critical")
-    verdict = "GOOD" if percentage >= 80.0 and critical_count == 0 else "NEEDS_WORK"
 
-    return {
-        "summary": {
-            "total_points": total_points,
-            "max_points": max_points,
-            "score_percent": percentage,
-            "critical_issue_count": critical_count,
-            "verdict": verdict,
-            "good_threshold": ">=80% score and 0 critical issues",
-        },
-        "requirements": [
+def _build_result(outcomes: list[RequirementOutcome]) -> dict[str, Any]:
+    # One walk over the outcomes collects the totals, the requirement rows and the ranked issues.
+    total_points = 0
+    max_points = 0
+    critical_count = 0
+    requirements: list[dict[str, Any]] = []
+    # Rank each issue once while collecting; the sort then only compares precomputed tuples.
+    ranked: list[tuple[tuple[int, str], dict[str, Any]]] = []
+    for outcome in outcomes:
+        total_points += outcome.points
+        max_points += outcome.max_points
+        requirements.append(
             {
                 "requirement_id": outcome.requirement_id,
                 "title": outcome.title,
@@ -750,71 +953,121 @@ def run_benchmark() -> dict[str, Any]:
                     for check in outcome.checks
                 ],
             }
-            for outcome in outcomes
-        ],
-        "issues": issues,
+        )
+        for check in outcome.failed_checks:
+            if check.severity == "critical":
+                critical_count += 1
+            ranked.append(
+                (
+                    (_SEVERITY_RANK.get(check.severity, 9), outcome.requirement_id),
+                    {
+                        "requirement_id": outcome.requirement_id,
+                        "title": outcome.title,
+                        "check": check.name,
+                        "severity": check.severity,
+                        "issue": check.issue or "Benchmark check failed.",
+                        "evidence": check.evidence,
+                    },
+                )
+            )
+    ranked.sort(key=itemgetter(0))
+    percentage = round((100.0 * total_points / max_points), 2) if max_points else 0.0
+    verdict = "GOOD" if percentage >= 80.0 and critical_count == 0 else "NEEDS_WORK"
+
+    return {
+        "summary": {
+            "total_points": total_points,
+            "max_points": max_points,
+            "score_percent": percentage,
+            "critical_issue_count": critical_count,
+            "verdict": verdict,
+            "good_threshold": ">=80% score and 0 critical issues",
+        },
+        "requirements": requirements,
+        "issues": [issue for _, issue in ranked],
     }
 
 
-def _render_markdown(result: dict[str, Any]) -> str:
-    summary = result["summary"]
-    lines: list[str] = []
-    lines.append("# CarePilot Chatbot Benchmark Report")
-    lines.append("")
-    lines.append("## Benchmark Rubric")
-    lines.append("- Score model: each requirement has 1-3 checks with binary scoring.")
-    lines.append("- `GOOD` threshold: >=80% total score and 0 critical issues.")
-    lines.append("- Coverage source: `PRODUCT_DETAIL.md` sections 4 and 6 (chatbot + agent system).")
-    lines.append("")
-    lines.append("## Summary")
-    lines.append(f"- Score: **{summary['total_points']}/{summary['max_points']} ({summary['score_percent']}%)**")
-    lines.append(f"- Critical issues: **{summary['critical_issue_count']}**")
-    lines.append(f"- Verdict: **{summary['verdict']}**")
-    lines.append("")
-    lines.append("## Requirement Results")
+_REPORT_HEAD_TMPL = """\
+# CarePilot Chatbot Benchmark Report
+
+## Benchmark Rubric
+- Score model: each requirement has 1-3 checks with binary scoring.
+- `GOOD` threshold: >=80% total score and 0 critical issues.
+- Coverage source: `PRODUCT_DETAIL.md` sections 4 and 6 (chatbot + agent system).
+
+## Summary
+- Score: **{total_points}/{max_points} ({score_percent}%)**
+- Critical issues: **{critical_issue_count}**
+- Verdict: **{verdict}**
+
+## Requirement Results"""
+_REQUIREMENT_TMPL = "- `{requirement_id}` {title}: **{status}** ({points}/{max_points})"
+_CHECK_TMPL = "  - [{marker}] {name} (severity={severity}, points={points}/{max_points})"
+_ISSUE_TMPL = "{index}. `{severity}` `{requirement_id}` {title} - {issue}\n   Evidence: {evidence}"
+_REPORT_TAIL = """\
+## Notes
+- This benchmark patches voice/document model calls for deterministic local evaluation.
+- Live web discovery is enabled by env (`CAREPILOT_DISABLE_EXTERNAL_WEB=false`), but network failures are allowed to fall back.
+"""
+
+
+def _render_markdown(result: dict[str, Any], out: TextIO) -> None:
+    out.write(_REPORT_HEAD_TMPL.format_map(result["summary"]))
     for requirement in result["requirements"]:
-        lines.append(
-            f"- `{requirement['requirement_id']}` {requirement['title']}: "
-            f"**{requirement['status']}** ({requirement['points']}/{requirement['max_points']})"
-        )
+        out.write("\n")
+        out.write(_REQUIREMENT_TMPL.format_map(requirement))
         for check in requirement["checks"]:
-            marker = "PASS" if check["passed"] else "FAIL"
-            lines.append(
-                f"  - [{marker}] {check['name']} "
-                f"(severity={check['severity']}, points={check['points']}/{check['max_points']})"
-            )
-    lines.append("")
-    lines.append("## Issues and Gaps")
+            out.write("\n")
+            out.write(_CHECK_TMPL.format(marker="PASS" if check["passed"] else "FAIL", **check))
+    out.write("\n\n## Issues and Gaps\n")
     if not result["issues"]:
-        lines.append("- No issues detected by this benchmark run.")
-    else:
-        for idx, issue in enumerate(result["issues"], start=1):
-            lines.append(
-                f"{idx}. `{issue['severity'].upper()}` `{issue['requirement_id']}` {issue['title']} - {issue['issue']}"
-            )
-            lines.append(f"   Evidence: {issue['evidence']}")
-    lines.append("")
-    lines.append("## Notes")
-    lines.append("- This benchmark patches voice/document model calls for deterministic local evaluation.")
-    lines.append("- Live web discovery is enabled by env (`CAREPILOT_DISABLE_EXTERNAL_WEB=false`), but network failures are allowed to fall back.")
-    return "\n".join(lines) + "\n"
+        out.write("- No issues detected by this benchmark run.")
+    for idx, issue in enumerate(result["issues"], start=1):
+        if idx > 1:
+            out.write("\n")
+        out.write(_ISSUE_TMPL.format(index=idx, **{**issue, "severity": issue["severity"].upper()}))
+    out.write("\n\n")
+    out.write(_REPORT_TAIL)
+
 
+def _write_if_changed(path: Path, data: bytes) -> bool:
+    # Leave identical artifacts untouched so their mtime (and anything keyed on it) stays put.
+    try:
+        if path.stat().st_size == len(data) and path.read_bytes() == data:
+            return False
+    except FileNotFoundError:
+        pass
+    path.write_bytes(data)
+    return True
 
-def main() -> int:
-    result = run_benchmark()
-    report_md = _render_markdown(result)
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Run the CarePilot chatbot product benchmark.")
+    parser.add_argument(
+        "--fail-fast",
+        action="store_true",
+        help="Stop after the first requirement with a critical failure and mark the rest SKIPPED.",
+    )
+    args = parser.parse_args(argv)
+    result = run_benchmark(fail_fast=args.fail_fast)
+    # Render into memory rather than straight to disk so an unchanged report can be left alone.
+    report_md = io.StringIO()
+    _render_markdown(result, report_md)
 
     results_path = ROOT / "CHATBOT_BENCHMARK_RESULTS.json"
     report_path = ROOT / "CHATBOT_BENCHMARK_ISSUES.md"
-    results_path.write_text(json.dumps(result, indent=2), encoding="utf-8")
-    report_path.write_text(report_md, encoding="utf-8")
+    # The artifact always goes through stdlib json so its bytes do not depend on whether orjson is
+    # installed, which keeps the unchanged-file check meaningful across environments.
+    results_written = _write_if_changed(results_path, json.dumps(result, indent=2).encode("utf-8"))
+    report_written = _write_if_changed(report_path, report_md.getvalue().encode("utf-8"))
 
     summary = result["summary"]
     print(f"Benchmark score: {summary['total_points']}/{summary['max_points']} ({summary['score_percent']}%)")
     print(f"Critical issues: {summary['critical_issue_count']}")
     print(f"Verdict: {summary['verdict']}")
-    print(f"Wrote: {results_path}")
-    print(f"Wrote: {report_path}")
+    print(f"{'Wrote' if results_written else 'Unchanged'}: {results_path}")
+    print(f"{'Wrote' if report_written else 'Unchanged'}: {report_path}")
     return 0
 
 
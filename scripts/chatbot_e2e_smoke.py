@@ -1,74 +1,272 @@
 #!/usr/bin/env python3
 from __future__ import annotations
 
+import asyncio
 import importlib
+import itertools
 import json
 import os
 import sys
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterator
 
-from fastapi.testclient import TestClient
+import httpx
 
+try:
+  import orjson
+except ImportError:  # optional speedup; stdlib json is the fallback
+  orjson = None
 
-@dataclass
+
+# Every smoke request is a JSON POST as the same user, so the headers are shared and never rebuilt.
+_HEADERS = {"Authorization": "Bearer smoke-user", "Content-Type": "application/json"}
+_CLIENT_CONTEXT = {"timezone": "America/New_York", "location_text": "Pittsburgh"}
+_ACCEPTED_ACTION_STATUSES = frozenset({"succeeded", "pending", "partial", "failed", "success"})
+_CONTACT_FIELDS = frozenset({"full_name", "email", "phone"})
+
+
+@dataclass(frozen=True, slots=True)
 class Scenario:
   name: str
   message: str
   expected_tool: str
 
 
-def parse_sse_events(payload_text: str) -> list[dict[str, Any]]:
-  events: list[dict[str, Any]] = []
-  current: dict[str, Any] = {}
-  for raw_line in payload_text.splitlines():
-    line = raw_line.strip("\r")
-    if line.startswith("event: "):
-      current["event"] = line[7:]
-    elif line.startswith("data: "):
-      current["data"] = line[6:]
+@dataclass(frozen=True, slots=True)
+class ExecuteSummary:
+  status: str | None
+  action_status: str | None
+  missing_fields: frozenset[str] = frozenset()
+
+  @classmethod
+  def from_body(cls, body: Any) -> ExecuteSummary:
+    # Validate the /actions/execute shape once; anything unexpected reads as a missing field.
+    body = body if isinstance(body, dict) else {}
+    status = body.get("status") if isinstance(body.get("status"), str) else None
+    outcome = body.get("result")
+    action_status: str | None = None
+    missing_fields: frozenset[str] = frozenset()
+    if isinstance(outcome, dict):
+      direct = outcome.get("status")
+      lifecycle = outcome.get("lifecycle")
+      if isinstance(direct, str) and direct:
+        action_status = direct
+      elif isinstance(lifecycle, list) and lifecycle and isinstance(lifecycle[-1], str):
+        action_status = lifecycle[-1]
+      missing = outcome.get("missing_fields")
+      if isinstance(missing, list):
+        missing_fields = frozenset(field for field in missing if isinstance(field, str))
+    return cls(status=status, action_status=action_status or status, missing_fields=missing_fields)
+
+
+def _dumps(payload: Any) -> bytes:
+  if orjson is not None:
+    return orjson.dumps(payload)
+  return json.dumps(payload).encode("utf-8")
+
+
+def _loads(data: bytes) -> Any:
+  # Both decoders raise ValueError subclasses on malformed input.
+  if orjson is not None:
+    return orjson.loads(data)
+  return json.loads(data)
+
+
+def _report_json(payload: Any, *, compact: bool = False) -> str:
+  if orjson is not None:
+    return orjson.dumps(payload, option=None if compact else orjson.OPT_INDENT_2).decode("utf-8")
+  if compact:
+    return json.dumps(payload, separators=(",", ":"), ensure_ascii=True)
+  return json.dumps(payload, indent=2, ensure_ascii=True)
+
+
+_SCENARIO_TMPL = """\
+### {status} - {name}
+- Expected tool: `{expected_tool}`
+- Actual tool: `{actual_tool}`
+- Chat status code: `{chat_status_code}`
+- Execute status code: `{execute_status_code}`
+- Action lifecycle status: `{action_status}`
+{notes}- Action plan payload:
+```json
+{action_plan}
+```
+- Execute response payload:
+```json
+{execute_body}
+```
+"""
+
+
+def _format_scenario(item: dict[str, Any], *, compact: bool = False) -> str:
+  notes = ""
+  if item.get("error"):
+    notes += f"- Error: `{item['error']}`\n"
+  preview = item.get("chat_message_preview") or ""
+  if preview:
+    notes += f"- Chat preview: `{preview}`\n"
+  return _SCENARIO_TMPL.format(
+    status="PASS" if item.get("pass") else "FAIL",
+    name=item["name"],
+    expected_tool=item.get("expected_tool"),
+    actual_tool=item.get("actual_tool"),
+    chat_status_code=item.get("chat_status_code"),
+    execute_status_code=item.get("execute_status_code"),
+    action_status=item.get("action_status"),
+    notes=notes,
+    action_plan=_report_json(item.get("action_plan"), compact=compact),
+    execute_body=_report_json(item.get("execute_body"), compact=compact),
+  )
+
+
+def _iter_sse_events(payload_text: str) -> Iterator[tuple[str | None, str | None]]:
+  # Yields (event, raw data) per event as soon as its terminating blank line is seen.
+  current: dict[str, str] = {}
+  # The trailing blank line flushes an event the stream did not terminate.
+  for line in itertools.chain(payload_text.splitlines(), ("",)):
+    field_name, sep, value = line.partition(": ")
+    if sep and field_name in ("event", "data"):
+      current[field_name] = value
     elif line == "" and current:
-      events.append(current)
+      yield current.get("event"), current.get("data")
       current = {}
-  if current:
-    events.append(current)
-  return events
 
 
-def first_event_payload(events: list[dict[str, Any]], event_name: str) -> Any | None:
-  for event in events:
-    if event.get("event") != event_name:
-      continue
-    raw = event.get("data")
-    if not isinstance(raw, str):
-      return raw
-    try:
-      return json.loads(raw)
-    except json.JSONDecodeError:
-      return raw
-  return None
-
-
-def token_text(events: list[dict[str, Any]]) -> str:
+def _token_text(raw_tokens: list[str]) -> str:
   chunks: list[str] = []
-  for event in events:
-    if event.get("event") != "token":
-      continue
-    raw = event.get("data")
-    if not isinstance(raw, str):
-      continue
+  for raw in raw_tokens:
     try:
-      payload = json.loads(raw)
-      delta = payload.get("delta")
-      if isinstance(delta, str):
-        chunks.append(delta)
+      delta = json.loads(raw).get("delta")
     except json.JSONDecodeError:
       continue
+    if isinstance(delta, str):
+      chunks.append(delta)
   return "".join(chunks)
 
 
+def _parse_stream(payload_text: str) -> dict[str, Any]:
+  # Token payloads stay raw: they are only decoded if the message event carries no text.
+  parsed: dict[str, Any] = {"raw_tokens": [], "action_plan": None, "message": None, "event_types": []}
+  found: set[str] = set()
+  for event_name, raw in _iter_sse_events(payload_text):
+    parsed["event_types"].append(event_name)
+    if raw is None:
+      if event_name in ("action_plan", "message"):
+        found.add(event_name)
+      continue
+    if event_name == "token":
+      parsed["raw_tokens"].append(raw)
+    elif event_name in ("action_plan", "message") and event_name not in found:
+      found.add(event_name)
+      try:
+        parsed[event_name] = json.loads(raw)
+      except json.JSONDecodeError:
+        parsed[event_name] = raw
+  return parsed
+
+
+async def _run_scenario(client: httpx.AsyncClient, scenario: Scenario, *, session_key: str) -> dict[str, Any]:
+  chat_response = await client.post(
+    "/chat/stream",
+    headers=_HEADERS,
+    content=_dumps(
+      {
+        "message": scenario.message,
+        "session_key": session_key,
+        "history": [],
+        "client_context": _CLIENT_CONTEXT,
+      }
+    ),
+  )
+
+  scenario_result: dict[str, Any] = {
+    "name": scenario.name,
+    "expected_tool": scenario.expected_tool,
+    "chat_status_code": chat_response.status_code,
+  }
+
+  if chat_response.status_code != 200:
+    scenario_result["pass"] = False
+    scenario_result["error"] = f"/chat/stream returned {chat_response.status_code}"
+    return scenario_result
+
+  stream = _parse_stream(chat_response.text)
+  plan = stream["action_plan"]
+  message_payload = stream["message"]
+  message_text = ""
+  if isinstance(message_payload, dict):
+    maybe_text = message_payload.get("text")
+    if isinstance(maybe_text, str):
+      message_text = maybe_text
+  if not message_text:
+    message_text = _token_text(stream["raw_tokens"])
+
+  scenario_result["chat_message_preview"] = message_text[:240]
+  scenario_result["event_types"] = stream["event_types"]
+  scenario_result["action_plan"] = plan
+
+  if not isinstance(plan, dict):
+    scenario_result["pass"] = False
+    scenario_result["error"] = "No action_plan event emitted."
+    return scenario_result
+
+  actual_tool = plan.get("tool")
+  scenario_result["actual_tool"] = actual_tool
+  if actual_tool != scenario.expected_tool:
+    scenario_result["pass"] = False
+    scenario_result["error"] = f"Expected tool {scenario.expected_tool}, got {actual_tool!r}"
+    return scenario_result
+
+  execute_response = await client.post(
+    "/actions/execute",
+    headers=_HEADERS,
+    content=_dumps(
+      {
+        "plan": plan,
+        "user_confirmed": True,
+        "session_key": session_key,
+        "message_text": scenario.message,
+      }
+    ),
+  )
+  scenario_result["execute_status_code"] = execute_response.status_code
+
+  try:
+    execute_body = _loads(execute_response.content)
+  except ValueError:
+    execute_body = {"raw": execute_response.text[:500]}
+  scenario_result["execute_body"] = execute_body
+
+  summary = ExecuteSummary.from_body(execute_body)
+  scenario_result["action_status"] = summary.action_status
+
+  # Smoke success criterion: plan exists, expected tool is selected, execution endpoint accepts approval.
+  scenario_result["pass"] = (
+    execute_response.status_code == 200
+    and summary.status == "success"
+    and summary.action_status in _ACCEPTED_ACTION_STATUSES
+  )
+  if not scenario_result["pass"]:
+    scenario_result["error"] = "Execution did not return an accepted action lifecycle status."
+  elif summary.missing_fields & _CONTACT_FIELDS:
+    scenario_result["pass"] = False
+    scenario_result["error"] = (
+      f"Execution is missing contact details: {', '.join(sorted(summary.missing_fields & _CONTACT_FIELDS))}"
+    )
+
+  return scenario_result
+
+
+async def _run_scenarios(app: Any, scenarios: list[Scenario], *, session_key: str) -> list[dict[str, Any]]:
+  # Scenarios run in order in one session: purchase reuses the contact details that the booking
+  # execute stores as appointment defaults, and the backend only reads those back in the same session.
+  transport = httpx.ASGITransport(app=app)
+  async with httpx.AsyncClient(transport=transport, base_url="http://testserver") as client:
+    return [await _run_scenario(client, scenario, session_key=session_key) for scenario in scenarios]
+
+
 def run() -> int:
   repo_root = Path(__file__).resolve().parents[1]
   backend_dir = repo_root / "backend"
@@ -80,10 +278,12 @@ def run() -> int:
   os.environ.setdefault("CAREPILOT_DISABLE_EXTERNAL_WEB", "false")
 
   backend_module = importlib.import_module("main")
-  backend_module = importlib.reload(backend_module)
+  # A fresh process imports main with the env above already applied; only re-import when asked to.
+  if os.getenv("CAREPILOT_FORCE_RELOAD", "false").lower() in {"1", "true", "yes"}:
+    backend_module = importlib.reload(backend_module)
 
-  session_key = f"smoke-session-{datetime.now(timezone.utc).strftime('%Y%m%d%H%M%S')}"
-  headers = {"Authorization": "Bearer smoke-user"}
+  started_at = datetime.now(timezone.utc)
+  session_key = f"smoke-session-{started_at:%Y%m%d%H%M%S}"
 
   scenarios = [
     Scenario(
@@ -111,114 +311,13 @@ def run() -> int:
     ),
   ]
 
-  results: list[dict[str, Any]] = []
-
-  with TestClient(backend_module.app) as client:
-    for scenario in scenarios:
-      chat_response = client.post(
-        "/chat/stream",
-        headers=headers,
-        json={
-          "message": scenario.message,
-          "session_key": session_key,
-          "history": [],
-          "client_context": {
-            "timezone": "America/New_York",
-            "location_text": "Pittsburgh",
-          },
-        },
-      )
-
-      scenario_result: dict[str, Any] = {
-        "name": scenario.name,
-        "expected_tool": scenario.expected_tool,
-        "chat_status_code": chat_response.status_code,
-      }
-
-      if chat_response.status_code != 200:
-        scenario_result["pass"] = False
-        scenario_result["error"] = f"/chat/stream returned {chat_response.status_code}"
-        results.append(scenario_result)
-        continue
-
-      events = parse_sse_events(chat_response.text)
-      plan = first_event_payload(events, "action_plan")
-      message_payload = first_event_payload(events, "message")
-      message_text = ""
-      if isinstance(message_payload, dict):
-        maybe_text = message_payload.get("text")
-        if isinstance(maybe_text, str):
-          message_text = maybe_text
-      if not message_text:
-        message_text = token_text(events)
-
-      scenario_result["chat_message_preview"] = message_text[:240]
-      scenario_result["event_types"] = [event.get("event") for event in events]
-      scenario_result["action_plan"] = plan
-
-      if not isinstance(plan, dict):
-        scenario_result["pass"] = False
-        scenario_result["error"] = "No action_plan event emitted."
-        results.append(scenario_result)
-        continue
-
-      actual_tool = plan.get("tool")
-      scenario_result["actual_tool"] = actual_tool
-      if actual_tool != scenario.expected_tool:
-        scenario_result["pass"] = False
-        scenario_result["error"] = f"Expected tool {scenario.expected_tool}, got {actual_tool!r}"
-        results.append(scenario_result)
-        continue
-
-      execute_response = client.post(
-        "/actions/execute",
-        headers=headers,
-        json={
-          "plan": plan,
-          "user_confirmed": True,
-          "session_key": session_key,
-          "message_text": scenario.message,
-        },
-      )
-      scenario_result["execute_status_code"] = execute_response.status_code
-
-      execute_body: dict[str, Any] = {}
-      try:
-        execute_body = execute_response.json()
-      except Exception:
-        execute_body = {"raw": execute_response.text[:500]}
-      scenario_result["execute_body"] = execute_body
-
-      top_status = execute_body.get("status") if isinstance(execute_body, dict) else None
-      outcome = execute_body.get("result") if isinstance(execute_body, dict) else None
-      action_status: str | None = None
-      if isinstance(outcome, dict):
-        direct = outcome.get("status")
-        if isinstance(direct, str) and direct:
-          action_status = direct
-        elif isinstance(outcome.get("lifecycle"), list) and outcome["lifecycle"]:
-          tail = outcome["lifecycle"][-1]
-          if isinstance(tail, str):
-            action_status = tail
-      if action_status is None and isinstance(top_status, str):
-        action_status = top_status
-      scenario_result["action_status"] = action_status
-
-      # Smoke success criterion: plan exists, expected tool is selected, execution endpoint accepts approval.
-      scenario_result["pass"] = (
-        execute_response.status_code == 200
-        and top_status == "success"
-        and isinstance(action_status, str)
-        and action_status in {"succeeded", "pending", "partial", "failed", "success"}
-      )
-      if not scenario_result["pass"]:
-        scenario_result["error"] = "Execution did not return an accepted action lifecycle status."
-
-      results.append(scenario_result)
+  results = asyncio.run(
+    _run_scenarios(backend_module.app, scenarios, session_key=session_key)
+  )
 
   passed = sum(1 for item in results if item.get("pass"))
   failed = len(results) - passed
-  timestamp = datetime.now(timezone.utc).isoformat()
+  timestamp = started_at.isoformat()
 
   report_lines = [
     "# Chatbot E2E Smoke Report",
@@ -234,28 +333,9 @@ def run() -> int:
     "",
   ]
 
-  for item in results:
-    status = "PASS" if item.get("pass") else "FAIL"
-    report_lines.append(f"### {status} - {item['name']}")
-    report_lines.append(f"- Expected tool: `{item.get('expected_tool')}`")
-    report_lines.append(f"- Actual tool: `{item.get('actual_tool')}`")
-    report_lines.append(f"- Chat status code: `{item.get('chat_status_code')}`")
-    report_lines.append(f"- Execute status code: `{item.get('execute_status_code')}`")
-    report_lines.append(f"- Action lifecycle status: `{item.get('action_status')}`")
-    if item.get("error"):
-      report_lines.append(f"- Error: `{item['error']}`")
-    preview = item.get("chat_message_preview") or ""
-    if preview:
-      report_lines.append(f"- Chat preview: `{preview}`")
-    report_lines.append("- Action plan payload:")
-    report_lines.append("```json")
-    report_lines.append(json.dumps(item.get("action_plan"), indent=2, ensure_ascii=True))
-    report_lines.append("```")
-    report_lines.append("- Execute response payload:")
-    report_lines.append("```json")
-    report_lines.append(json.dumps(item.get("execute_body"), indent=2, ensure_ascii=True))
-    report_lines.append("```")
-    report_lines.append("")
+  # SMOKE_REPORT_COMPACT=true writes single-line payload blocks for CI artifacts.
+  compact = os.getenv("SMOKE_REPORT_COMPACT", "false").lower() in {"1", "true", "yes"}
+  report_lines.extend(_format_scenario(item, compact=compact) for item in results)
 
   report_path = repo_root / "CHATBOT_E2E_SMOKE_REPORT.md"
   report_path.write_text("\n".join(report_lines), encoding="utf-8")